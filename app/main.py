@@ -19,13 +19,16 @@ from functools import lru_cache
 
 from app.models.schemas import (
     VideoProcessRequest,
+    DubAudioRequest,
     ContentOutput,
     ProcessingResponse,
     AnalysisOutput,
 )
-from app.services.whisper_service import WhisperService
+from app.services.whisper_service import WhisperService, close_groq_http_client
 from app.services.airtable_service import AirtableService
 from app.chains import ContentGenerationEngine
+from app.utils.openai_client import close_openai_client
+from app.utils.http_client import close_http_client
 
 # Load environment variables
 load_dotenv()
@@ -95,9 +98,34 @@ logging.getLogger().addHandler(ws_log_handler)
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     logger.info("Starting Omni-Channel Content Repurposing Engine...")
+
+    # Shared Airtable service whose background task batches status updates
+    try:
+        app.state.airtable = AirtableService()
+        app.state.airtable.start_flusher()
+    except ValueError as e:
+        logger.warning(f"Airtable status flusher disabled: {str(e)}")
+        app.state.airtable = None
+
     yield
     logger.info("Shutting down...")
 
+    if app.state.airtable:
+        try:
+            await app.state.airtable.stop_flusher()
+        except Exception as e:
+            logger.error(f"Dropped unsent Airtable status updates: {str(e)}")
+    await close_openai_client()
+    await close_http_client()
+    await close_groq_http_client()
+
+    # Only loaded if a carousel was rendered; avoids importing Playwright here
+    import sys
+    if "app.services.visual_service" in sys.modules:
+        from app.services.visual_service import close_browser, shutdown_process_pool
+        await close_browser()
+        await asyncio.to_thread(shutdown_process_pool)
+
 
 app = FastAPI(
     title="Omni-Channel Content Repurposing Engine",
@@ -106,6 +134,18 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+
+def get_airtable_service() -> AirtableService:
+    """
+    Return the app's shared Airtable service, so every handler queues status
+    updates on the one flusher the lifespan stops (and drains) at shutdown.
+    Raises ValueError if Airtable isn't configured.
+    """
+    if getattr(app.state, "airtable", None) is None:
+        app.state.airtable = AirtableService()
+    return app.state.airtable
+
+
 # CORS middleware - Note: wildcard origin requires credentials=False
 app.add_middleware(
     CORSMiddleware,
@@ -298,7 +338,7 @@ async def process_video_pipeline(
         if not transcript_response.full_text:
             raise ValueError("Transcription returned empty result")
         
-        logger.info(f"Transcription complete: {len(transcript_response.segments)} segments")
+        logger.info(f"Transcription complete: {len(transcript_response.full_text)} characters")
         
         # Phase 3: Content Generation (No more video clipping - faster!)
         logger.info("Phase 3: Generating content...")
@@ -350,7 +390,7 @@ async def process_video_pipeline(
         from app.services.seo_service import SEOService
         seo_service = SEOService()
         try:
-            score_result = seo_service.score_article(
+            score_result = seo_service.score_article_cached(
                 generated_content.get("blog_post", ""),
                 keyword=analysis_output.big_idea.split()[0] if analysis_output.big_idea else None
             )
@@ -394,7 +434,7 @@ async def process_video_pipeline(
         
         # Phase 5: Store in Airtable
         logger.info("Phase 5: Storing in Airtable...")
-        airtable_service = AirtableService()
+        airtable_service = get_airtable_service()
         record_data = airtable_service.create_record(
             client_id=client_id,
             content=content_output,
@@ -572,6 +612,37 @@ from fastapi.responses import StreamingResponse
 import json
 import asyncio
 
+@app.post("/dub-audio")
+async def dub_audio(request: DubAudioRequest):
+    """
+    Translate text and stream the cloned-voice MP3 back as ElevenLabs
+    produces it, without writing it to disk.
+    """
+    from app.services.audio_service import AudioService
+    audio_service = AudioService()
+    if not audio_service.el_client:
+        raise HTTPException(status_code=503, detail="ELEVENLABS_API_KEY is not configured")
+    
+    translated = await audio_service.translate_text(request.text, target_lang=request.target_lang)
+    chunks = audio_service.stream_cloned_audio(translated, request.voice_id)
+    
+    # Pull the first chunk before responding, so TTS failures still get an error status
+    try:
+        first_chunk = await anext(chunks)
+    except StopAsyncIteration:
+        raise HTTPException(status_code=502, detail="ElevenLabs returned no audio")
+    except Exception as e:
+        logger.error(f"Dubbing failed: {str(e)}")
+        raise HTTPException(status_code=502, detail=f"Audio generation failed: {str(e)}")
+    
+    async def audio_stream():
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+    
+    return StreamingResponse(audio_stream(), media_type="audio/mpeg")
+
+
 @app.post("/process-video-stream")
 async def process_video_stream(request: VideoProcessRequest):
     """
@@ -582,7 +653,7 @@ async def process_video_stream(request: VideoProcessRequest):
             # Instantiate services
             whisper_service = WhisperService()
             content_engine = ContentGenerationEngine()
-            airtable_service = AirtableService()
+            airtable_service = get_airtable_service()
             
             # 1. Validate URL
             if not await validate_video_url(request.video_url):
@@ -595,7 +666,6 @@ async def process_video_stream(request: VideoProcessRequest):
             
             try:
                 import queue
-                import threading
                 
                 progress_queue = queue.Queue()
                 last_progress = [5]  # Use list to allow mutation in nested function
@@ -606,40 +676,24 @@ async def process_video_stream(request: VideoProcessRequest):
                         progress_queue.put(p)
                         last_progress[0] = p
                 
-                # Start transcription in background
-                result_container = [None, None]  # [result, error]
-                
-                def run_transcription():
-                    try:
-                        result_container[0] = whisper_service.transcribe_from_url(
-                            str(request.video_url),
-                            progress_callback=progress_callback
-                        )
-                    except Exception as e:
-                        result_container[1] = e
-                    finally:
-                        progress_queue.put(None)  # Signal completion
-                
-                thread = threading.Thread(target=run_transcription)
-                thread.start()
+                # Start transcription in background (on this loop; yt-dlp
+                # reports progress from its own thread)
+                transcription_task = asyncio.create_task(
+                    whisper_service.transcribe_from_url_async(
+                        str(request.video_url),
+                        progress_callback=progress_callback
+                    )
+                )
                 
                 # Poll for progress updates while transcription runs
-                while True:
+                while not transcription_task.done() or not progress_queue.empty():
                     try:
-                        progress = progress_queue.get(timeout=0.1)
-                        if progress is None:
-                            break  # Transcription complete
+                        progress = progress_queue.get_nowait()
                         yield json.dumps({"type": "progress", "step": "transcription", "percent": int(progress)}) + "\n"
                     except queue.Empty:
                         await asyncio.sleep(0.05)  # Yield control to event loop
-                        continue
-                
-                thread.join()
-                
-                if result_container[1]:
-                    raise result_container[1]
                 
-                transcript_res = result_container[0]
+                transcript_res = await transcription_task
                 yield json.dumps({"type": "progress", "step": "transcription", "percent": 100}) + "\n"
                 yield json.dumps({"type": "transcript", "data": transcript_res.dict()}) + "\n"
             except Exception as e:
@@ -728,8 +782,8 @@ async def process_video_stream(request: VideoProcessRequest):
                     from app.services.seo_service import SEOService
                     seo_service = SEOService()
                     if generated_content["blog_post"]:
-                        # score_article is synchronous
-                        score = seo_service.score_article(generated_content["blog_post"])
+                        # score_article_cached is synchronous
+                        score = seo_service.score_article_cached(generated_content["blog_post"])
                         # Convert SEOScore object to dict for JSON serialization
                         score_dict = {
                             "score": score.score,
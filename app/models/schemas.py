@@ -21,6 +21,14 @@ class VideoProcessRequest(BaseModel):
     )
 
 
+class DubAudioRequest(BaseModel):
+    """Input payload for the /dub-audio endpoint."""
+    
+    text: str = Field(..., min_length=1, max_length=5000, description="Text to translate and voice")
+    target_lang: str = Field(default="ES", description="DeepL target language (e.g., ES, HI)")
+    voice_id: Optional[str] = Field(None, description="ElevenLabs voice ID; defaults to Rachel")
+
+
 class TranscriptSegment(BaseModel):
     """A segment of transcribed text with timestamp and speaker info."""
     
@@ -3,15 +3,20 @@ Airtable service for storing generated content.
 """
 
 import os
+import asyncio
 import logging
 from typing import Optional, Any
 
 from pyairtable import Api, Table
 
 from app.models.schemas import ContentOutput
+from app.utils.retry import retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
+# Status updates arriving within this window of the first are coalesced into one batch PATCH
+STATUS_FLUSH_INTERVAL = 0.25
+
 
 class AirtableService:
     """Service for storing content assets in Airtable."""
@@ -41,6 +46,12 @@ class AirtableService:
         
         self.api = Api(self.api_key)
         self.table = self.api.table(self.base_id, self.table_name)
+        
+        # Write-coalescing queue for status updates (drained by _flush_loop),
+        # and updates taken off it but not yet sent
+        self._update_queue: asyncio.Queue[tuple[str, dict]] = asyncio.Queue()
+        self._pending: dict[str, dict] = {}
+        self._flush_task: Optional[asyncio.Task] = None
     
     def create_record(
         self,
@@ -67,10 +78,10 @@ class AirtableService:
                 "Video_URL": str(video_url),
                 "Big_Idea": content.analysis.big_idea,
                 "Tone": content.analysis.tone,
-                "Strong_Takes": "\n\n".join(
-                    f"{i+1}. {take}" 
+                "Strong_Takes": "\n\n".join([
+                    f"{i+1}. {take}"
                     for i, take in enumerate(content.analysis.strong_takes)
-                ),
+                ]),
                 "LinkedIn_Draft": content.linkedin_post,
                 "Twitter_Thread": self._format_twitter_thread(content.twitter_thread),
                 "Blog_HTML": content.blog_post,
@@ -78,22 +89,24 @@ class AirtableService:
             
             # Add new production feature fields
             if content.linkedin_hooks:
-                fields["LinkedIn_Hooks"] = "\n\n".join(
+                fields["LinkedIn_Hooks"] = "\n\n".join([
                     f"[{h.get('framework', 'Unknown')}] {h.get('hook', '')}" for h in content.linkedin_hooks
-                )
+                ])
             
             if content.seo_score:
                 fields["SEO_Score"] = f"{content.seo_score.get('grade', 'N/A')} ({content.seo_score.get('score', 0)})"
                 fields["SEO_Feedback"] = "\n".join(content.seo_score.get('feedback', []))
             
             if content.broll_images:
-                # Save as single text block (for new column)
-                fields["B_Roll_Images"] = "\n".join(
-                    f"{img.get('keyword', 'Image')}: {img.get('image_url', '')}" for img in content.broll_images
-                )
-                # ALSO map to legacy Clip columns (so they appear in existing table)
-                for i, img in enumerate(content.broll_images[:3]):
-                    fields[f"Clip_{i+1}_URL"] = img.get('image_url', '')
+                # One pass: text block for the new column, plus the first 3
+                # URLs mapped to legacy Clip columns (so they appear in existing table)
+                broll_lines = []
+                for i, img in enumerate(content.broll_images):
+                    image_url = img.get('image_url', '')
+                    broll_lines.append(f"{img.get('keyword', 'Image')}: {image_url}")
+                    if i < 3:
+                        fields[f"Clip_{i+1}_URL"] = image_url
+                fields["B_Roll_Images"] = "\n".join(broll_lines)
             
             if content.newsletter_html:
                 fields["Newsletter_HTML"] = content.newsletter_html[:100000]  # Airtable cell limit
@@ -140,20 +153,87 @@ class AirtableService:
                 "error": str(e)
             }
     
-    def update_record_status(self, record_id: str, status: str) -> None:
+    async def update_record_status(self, record_id: str, status: str) -> None:
         """
-        Update the status of an existing record.
+        Queue a status update for an existing record.
+        
+        Updates are coalesced by the background flusher and sent with
+        Airtable's batch PATCH, so this returns without a round-trip.
         
         Args:
             record_id: Airtable record ID
             status: New status value
         """
+        self.start_flusher()
+        await self._update_queue.put((record_id, {"Status": status}))
+    
+    def start_flusher(self) -> None:
+        """Start the background status flusher if it is not already running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def stop_flusher(self) -> None:
+        """
+        Stop the background flusher, sending any updates still queued.
+        
+        Raises:
+            Exception: If the final batch still fails after retries
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self._flush_pending()
+    
+    async def _flush_loop(self) -> None:
+        """
+        Wait for an update, give others STATUS_FLUSH_INTERVAL seconds to
+        join it, then send them together. Idle until an update arrives.
+        """
+        while True:
+            record_id, fields = await self._update_queue.get()
+            self._pending.setdefault(record_id, {}).update(fields)
+            await asyncio.sleep(STATUS_FLUSH_INTERVAL)
+            try:
+                await self._flush_pending()
+            except Exception as e:
+                # Already retried; the batch stays pending for the next flush
+                logger.error(f"Failed to update record status: {str(e)}")
+    
+    async def _flush_pending(self) -> None:
+        """
+        Send all queued updates as batch PATCH requests.
+        
+        Multiple updates to the same record are merged so only the latest
+        fields are sent. pyairtable splits the batch into chunks of 10.
+        A batch that still fails after retries is put back (under any newer
+        updates to the same records) and the error re-raised.
+        """
+        while not self._update_queue.empty():
+            record_id, fields = self._update_queue.get_nowait()
+            self._pending.setdefault(record_id, {}).update(fields)
+        
+        if not self._pending:
+            return
+        
+        pending, self._pending = self._pending, {}
+        records = [{"id": rid, "fields": fields} for rid, fields in pending.items()]
         try:
-            self.table.update(record_id, {"Status": status})
-            logger.info(f"Updated record {record_id} status to: {status}")
-        except Exception as e:
-            logger.error(f"Failed to update record status: {str(e)}")
+            await self._send_batch(records)
+        except BaseException:
+            # Includes cancellation by stop_flusher, which then resends them
+            for rid, fields in pending.items():
+                self._pending[rid] = {**fields, **self._pending.get(rid, {})}
             raise
+        logger.info(f"Flushed {len(records)} record status update(s)")
+    
+    @retry_with_backoff(max_retries=3, base_delay=1.0)
+    async def _send_batch(self, records: list[dict]) -> None:
+        """Send one batch PATCH, retrying failed requests with backoff."""
+        await asyncio.to_thread(self.table.batch_update, records)
     
     def _format_twitter_thread(self, tweets: list[str]) -> str:
         """
@@ -1,6 +1,8 @@
 import os
+import asyncio
 import logging
-from typing import Optional, List
+import secrets
+from typing import Optional, List, AsyncIterator
 from pathlib import Path
 
 import deepl
@@ -45,6 +47,48 @@ class AudioService:
             logger.error(f"DeepL translation failed: {str(e)}")
             return text
 
+    def _convert(self, text: str, voice_id: Optional[str]):
+        """Start an ElevenLabs TTS request; returns the SDK's blocking chunk iterator."""
+        # Standard ElevenLabs voices available on all accounts:
+        # - 21m00Tcm4TlvDq8ikWAM = Rachel (American, Female)
+        # - EXAVITQu4vr4xnSDxMaL = Bella (American, Female)
+        # - ErXwobaYiN019PkySvjV = Antoni (American, Male)
+        # - MF3mGyEYCl7XYWbV9V6O = Elli (American, Female)
+        actual_voice_id = voice_id or "21m00Tcm4TlvDq8ikWAM"  # Rachel
+        
+        # Use Flash v2.5 for sub-second low-latency generation
+        return self.el_client.text_to_speech.convert(
+            text=text,
+            voice_id=actual_voice_id,
+            model_id="eleven_flash_v2_5"
+        )
+
+    async def stream_cloned_audio(self, text: str, voice_id: Optional[str] = None) -> AsyncIterator[bytes]:
+        """
+        Stream dubbed audio chunks from ElevenLabs as they arrive.
+        Used by the /dub-audio endpoint to pipe audio straight into a
+        StreamingResponse without a disk round-trip.
+        """
+        if not self.el_client:
+            logger.warning("ElevenLabs client not initialized")
+            return
+        
+        # The SDK yields from a blocking HTTP stream; pull each chunk off-loop
+        chunks = iter(await asyncio.to_thread(self._convert, text, voice_id))
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                break
+            if chunk:
+                yield chunk
+
+    def _save_audio(self, text: str, voice_id: Optional[str], output_path: Path) -> None:
+        """Stream the TTS response straight to a file (blocking; run in a thread)."""
+        with open(output_path, "wb") as f:
+            for chunk in self._convert(text, voice_id):
+                if chunk:
+                    f.write(chunk)
+
     async def generate_cloned_audio(self, text: str, client_id: str, voice_id: Optional[str] = None) -> str:
         """
         Generate dubbed audio using ElevenLabs.
@@ -58,30 +102,12 @@ class AudioService:
         try:
             logger.info(f"Generating cloned audio for {client_id}")
             
-            # Standard ElevenLabs voices available on all accounts:
-            # - 21m00Tcm4TlvDq8ikWAM = Rachel (American, Female)
-            # - EXAVITQu4vr4xnSDxMaL = Bella (American, Female)
-            # - ErXwobaYiN019PkySvjV = Antoni (American, Male)
-            # - MF3mGyEYCl7XYWbV9V6O = Elli (American, Female)
-            actual_voice_id = voice_id or "21m00Tcm4TlvDq8ikWAM"  # Rachel
-            
-            # Use Flash v2.5 for sub-second low-latency generation
-            audio = self.el_client.text_to_speech.convert(
-                text=text,
-                voice_id=actual_voice_id,
-                model_id="eleven_flash_v2_5"
-            )
-            
-            import uuid
-            unique_id = uuid.uuid4().hex[:8]
+            unique_id = secrets.token_hex(4)
             output_filename = f"dubbed_{client_id}_{unique_id}.mp3"
             output_path = self.OUTPUT_DIR / output_filename
             
-            # Save the audio generator to file
-            with open(output_path, "wb") as f:
-                for chunk in audio:
-                    if chunk:
-                        f.write(chunk)
+            # The SDK read and the file writes all block; do them in one thread hop
+            await asyncio.to_thread(self._save_audio, text, voice_id, output_path)
             
             logger.info(f"Dubbed audio saved to {output_path}")
             return f"/data/audio/{output_path.name}"
@@ -89,15 +115,3 @@ class AudioService:
         except Exception as e:
             logger.error(f"ElevenLabs generation failed: {str(e)}")
             return ""
-
-    def get_available_voices(self) -> List[dict]:
-        """List available voices for this account."""
-        if not self.el_client:
-            return []
-        
-        try:
-            voices = self.el_client.voices.get_all()
-            return [{"id": v.voice_id, "name": v.name} for v in voices.voices]
-        except Exception as e:
-            logger.error(f"Failed to fetch voices: {str(e)}")
-            return []
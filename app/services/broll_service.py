@@ -4,20 +4,69 @@ Uses Pexels API to fetch royalty-free images based on content keywords.
 """
 
 import os
+import asyncio
 import logging
 import re
 from typing import Optional
 
 import httpx
+from async_lru import alru_cache
+
+from app.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+PEXELS_API_URL = "https://api.pexels.com/v1"
+
+# Keyword lookup cache (same niche -> same keywords across videos)
+PEXELS_CACHE_SIZE = int(os.getenv("PEXELS_CACHE_SIZE", "512"))
+PEXELS_CACHE_TTL = int(os.getenv("PEXELS_CACHE_TTL", "3600"))
+
+
+@alru_cache(maxsize=PEXELS_CACHE_SIZE, ttl=PEXELS_CACHE_TTL)
+async def _pexels_search(
+    api_key: str,
+    keyword: str,
+    per_page: int = 1,
+    orientation: str = "landscape"
+) -> Optional[dict]:
+    """
+    Search Pexels for a keyword and return the top photo.
+    
+    Results (including "no photos") are memoized; HTTP errors raise so
+    they are never cached.
+    
+    Args:
+        api_key: Pexels API key
+        keyword: Search keyword
+        per_page: Number of results to request
+        orientation: Photo orientation filter
+        
+    Returns:
+        Raw Pexels photo dict or None if nothing matched
+    """
+    # Shared keep-alive pool: concurrent keyword misses reuse connections
+    client = get_http_client()
+    response = await client.get(
+        f"{PEXELS_API_URL}/search",
+        params={"query": keyword, "per_page": per_page, "orientation": orientation},
+        headers={"Authorization": api_key}
+    )
+    
+    if response.status_code != 200:
+        raise httpx.HTTPStatusError(
+            f"Pexels API error: {response.status_code}",
+            request=response.request,
+            response=response
+        )
+    
+    photos = response.json().get("photos", [])
+    return photos[0] if photos else None
+
 
 class BRollService:
     """Service for fetching relevant B-roll images from Pexels."""
     
-    PEXELS_API_URL = "https://api.pexels.com/v1"
-    
     # Keyword extraction patterns
     STOP_WORDS = {
         "the", "a", "an", "is", "are", "was", "were", "be", "been",
@@ -70,46 +119,52 @@ class BRollService:
             logger.info("Skipping B-roll - no API key")
             return []
         
-        images = []
+        # Resolve keywords first so each unique keyword hits Pexels once
+        take_to_kw = [(take, self._extract_keyword(take)) for take in strong_takes]
+        unique_kws = list(dict.fromkeys(kw for _, kw in take_to_kw if kw))
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for take in strong_takes:
-                keyword = self._extract_keyword(take)
-                
-                if not keyword:
-                    continue
-                
-                try:
-                    response = await client.get(
-                        f"{self.PEXELS_API_URL}/search",
-                        params={"query": keyword, "per_page": per_take, "orientation": "landscape"},
-                        headers=self.headers
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        photos = data.get("photos", [])
-                        
-                        if photos:
-                            photo = photos[0]
-                            images.append({
-                                "strong_take": take,
-                                "keyword": keyword,
-                                "image_url": photo["src"]["medium"],
-                                "image_large": photo["src"]["large"],
-                                "photographer": photo["photographer"],
-                                "pexels_url": photo["url"],
-                                "alt": photo.get("alt", keyword)
-                            })
-                            logger.info(f"Found image for keyword: {keyword}")
-                    else:
-                        logger.warning(f"Pexels API error: {response.status_code}")
-                        
-                except Exception as e:
-                    logger.error(f"Failed to fetch image for '{keyword}': {str(e)}")
+        photos = await asyncio.gather(*[self._fetch_one(kw, per_take) for kw in unique_kws])
+        results = dict(zip(unique_kws, photos))
+        
+        images = []
+        for take, keyword in take_to_kw:
+            photo = results.get(keyword)
+            if not photo:
+                continue
+            
+            images.append({
+                "strong_take": take,
+                "keyword": keyword,
+                "image_url": photo["src"]["medium"],
+                "image_large": photo["src"]["large"],
+                "photographer": photo["photographer"],
+                "pexels_url": photo["url"],
+                "alt": photo.get("alt", keyword)
+            })
         
         return images
     
+    async def _fetch_one(self, keyword: str, per_take: int = 1) -> Optional[dict]:
+        """
+        Fetch (or recall from cache) the top Pexels photo for a keyword.
+        
+        Args:
+            keyword: Search keyword
+            per_take: Number of images to request
+            
+        Returns:
+            Raw Pexels photo dict or None
+        """
+        try:
+            photo = await _pexels_search(self.api_key, keyword, per_take, "landscape")
+        except Exception as e:
+            logger.error(f"Failed to fetch image for '{keyword}': {str(e)}")
+            return None
+        
+        if photo:
+            logger.info(f"Found image for keyword: {keyword}")
+        return photo
+    
     def _extract_keyword(self, text: str) -> str:
         """
         Extract the most relevant keyword from text.
@@ -146,8 +201,6 @@ class BRollService:
         Returns:
             Thumbnail URL or None
         """
-        import re
-        
         # Extract video ID
         patterns = [
             r'(?:v=|/embed/|/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
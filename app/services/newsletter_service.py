@@ -3,6 +3,7 @@ Newsletter Service - HTML Email Builder.
 Generates ready-to-send HTML emails from generated content.
 """
 
+import re
 import logging
 from typing import Optional
 from datetime import datetime
@@ -250,8 +251,6 @@ class NewsletterService:
         Returns:
             Thumbnail URL
         """
-        import re
-        
         patterns = [
             r'(?:v=|/embed/|/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
         ]
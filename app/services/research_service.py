@@ -1,13 +1,49 @@
 import os
 import logging
 import json
-from typing import List, Dict, Optional
+import asyncio
+import hashlib
+import weakref
+from typing import List, Dict, Optional, Any, Awaitable, Callable, Hashable, Tuple
 
-from tavily import TavilyClient
-from openai import AsyncOpenAI
+from cachetools import TTLCache
+from tavily import AsyncTavilyClient
+
+from app.utils.openai_client import TIMEOUTS, get_openai_client
+from app.utils.retry import retry_async
 
 logger = logging.getLogger(__name__)
 
+# Process-wide result caches (ResearchService is constructed per request)
+_TREND_CACHE: TTLCache = TTLCache(maxsize=512, ttl=1800)
+_CLAIMS_CACHE: TTLCache = TTLCache(maxsize=512, ttl=1800)
+_VERDICT_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=86400)
+
+# One lock per in-flight key so concurrent misses share a single API call
+_KEY_LOCKS: "weakref.WeakValueDictionary[Hashable, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+async def _get_or_compute(cache: TTLCache, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return cache[key], computing it at most once across concurrent callers.
+    Exceptions from compute propagate and are not cached.
+    """
+    if key in cache:
+        return cache[key]
+    
+    lock = _KEY_LOCKS.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _KEY_LOCKS[key] = lock
+    
+    async with lock:
+        if key in cache:
+            return cache[key]
+        value = await compute()
+        cache[key] = value
+        return value
+
+
 class ResearchService:
     """
     Phase 2: Deep Research Agent (The Brain)
@@ -21,106 +57,180 @@ class ResearchService:
         if not self.tavily_api_key:
             logger.warning("TAVILY_API_KEY not found in environment")
             
-        self.tavily = TavilyClient(api_key=self.tavily_api_key) if self.tavily_api_key else None
-        self.client = AsyncOpenAI(api_key=self.openai_api_key)
+        # Async client so per-claim searches overlap under asyncio.gather
+        self.tavily_async = AsyncTavilyClient(api_key=self.tavily_api_key) if self.tavily_api_key else None
+        self.client = get_openai_client()
 
     async def get_trending_context(self, topic: str) -> str:
         """
         Search for trending news related to the topic to 'jack' the trend in hooks.
         """
-        if not self.tavily:
+        if not self.tavily_async:
             return ""
             
-        logger.info(f"Searching for trending context on: {topic}")
+        cache_key = (topic.lower().strip(), os.getenv("CURRENT_DATE", "2025"))
         
         try:
-            # Search for latest news/trends
-            search_query = f"trending news and current events about {topic} {os.getenv('CURRENT_DATE', '2025')}"
-            search_result = self.tavily.search(query=search_query, search_depth="basic", max_results=3)
+            return await _get_or_compute(
+                _TREND_CACHE, cache_key, lambda: self._search_trending_context(topic)
+            )
+        except Exception as e:
+            logger.error(f"Trend-jacking search failed: {str(e)}")
+            return ""
+
+    @retry_async()
+    async def _search_trending_context(self, topic: str) -> str:
+        """Run the Tavily search + GPT summary behind get_trending_context."""
+        logger.info(f"Searching for trending context on: {topic}")
+        
+        # Search for latest news/trends
+        search_query = f"trending news and current events about {topic} {os.getenv('CURRENT_DATE', '2025')}"
+        search_result = await self.tavily_async.search(query=search_query, search_depth="basic", max_results=3)
+        
+        # Summarize the trends using GPT-4o
+        context = ""
+        for res in search_result.get("results", []):
+            context += f"- {res['title']}: {res['content'][:200]}...\n"
             
-            # Summarize the trends using GPT-4o
-            context = ""
-            for res in search_result.get("results", []):
-                context += f"- {res['title']}: {res['content'][:200]}...\n"
-                
-            summary_res = await self.client.chat.completions.create(
+        summary_res = await asyncio.wait_for(
+            self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "Summarize the following search results into a short 'Trend-Jacking' context (2 sentences max). Focus on what's happening RIGHT NOW that someone would care about."},
                     {"role": "user", "content": f"TOPIC: {topic}\nSEARCH RESULTS:\n{context}"}
-                ]
-            )
-            
-            return summary_res.choices[0].message.content
-        except Exception as e:
-            logger.error(f"Trend-jacking search failed: {str(e)}")
-            return ""
+                ],
+                max_tokens=150
+            ),
+            timeout=TIMEOUTS.llm_standard
+        )
+        
+        return summary_res.choices[0].message.content
 
     async def fact_check_claims(self, transcript_chunk: str) -> List[Dict]:
         """
         Identify specific numeric or factual claims in the transcript and verify them.
         """
-        if not self.tavily:
+        if not self.tavily_async:
             return []
             
         logger.info("Extracting and fact-checking claims from transcript")
         
         try:
-            # 1. Extract potential claims to verify
-            extract_res = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "Extract 2-3 specific factual or numeric claims from the following transcript that should be verified. Return as a JSON array of strings under a 'claims' key."},
-                    {"role": "user", "content": f"TRANSCRIPT: {transcript_chunk[:3000]}"}
-                ],
-                response_format={ "type": "json_object" }
+            # 1. Extract potential claims to verify (cached per transcript chunk)
+            chunk = transcript_chunk[:3000]
+            chunk_key = hashlib.blake2b(chunk.encode(), digest_size=16).digest()
+            claims = await _get_or_compute(
+                _CLAIMS_CACHE, chunk_key, lambda: self._extract_claims(chunk)
             )
             
-            claims_data = json.loads(extract_res.choices[0].message.content)
-            claims = claims_data.get("claims", [])
-            
-            if not claims:
-                # Fallback if the model didn't use the 'claims' key correctly
-                if isinstance(claims_data, dict) and len(claims_data) > 0:
-                    claims = list(claims_data.values())[0] if isinstance(list(claims_data.values())[0], list) else []
+            claims = claims[:2]
+            claim_keys = [" ".join(str(claim).lower().split()) for claim in claims]
             
-            verifications = []
+            # 2. Reuse cached verdicts; gather evidence for the rest in parallel
+            pending = [
+                (claim, key) for claim, key in zip(claims, claim_keys)
+                if key not in _VERDICT_CACHE
+            ]
             
-            # 2. Verify each claim in parallel
-            async def verify_single_claim(claim):
-                try:
-                    logger.info(f"Verifying claim: {claim}")
-                    search_query = f"is it true that {claim}"
-                    search_result = self.tavily.search(query=search_query, search_depth="basic", max_results=2)
-                    
-                    context = ""
-                    for res in search_result.get("results", []):
-                        context += f"{res['content']}\n"
-                    
-                    verify_res = await self.client.chat.completions.create(
-                        model="gpt-4o-mini",
-                        messages=[
-                            {"role": "system", "content": "Verify the claim based on the provided search context. Return a verdict (Correct, Misleading, or Incorrect) and a 1-sentence explanation as JSON."},
-                            {"role": "user", "content": f"CLAIM: {claim}\nCONTEXT:\n{context}"}
-                        ],
-                        response_format={ "type": "json_object" }
-                    )
-                    
-                    v_data = json.loads(verify_res.choices[0].message.content)
-                    return {
-                        "claim": claim,
-                        "verdict": v_data.get("verdict", "Inconclusive"),
-                        "explanation": v_data.get("explanation", "Could not verify claim.")
-                    }
-                except Exception as e:
-                    logger.error(f"Single verification failed: {e}")
-                    return None
-
-            import asyncio
-            verification_results = await asyncio.gather(*[verify_single_claim(claim) for claim in claims[:2]])
-            verifications = [res for res in verification_results if res]
+            if pending:
+                async def search_single_claim(claim):
+                    try:
+                        return await self._search_claim_context(claim)
+                    except Exception as e:
+                        logger.error(f"Claim search failed: {e}")
+                        return None
+
+                contexts = await asyncio.gather(*[search_single_claim(claim) for claim, _ in pending])
+                searched = [
+                    (claim, key, context) for (claim, key), context in zip(pending, contexts)
+                    if context is not None
+                ]
+                
+                # 3. One GPT call verifies every claim at once
+                if searched:
+                    try:
+                        verdicts = await self._verify_claims([(claim, context) for claim, _, context in searched])
+                        for (_, key, _), verdict in zip(searched, verdicts):
+                            _VERDICT_CACHE[key] = verdict
+                    except Exception as e:
+                        logger.error(f"Batch verification failed: {e}")
             
-            return verifications
+            return [_VERDICT_CACHE[key] for key in claim_keys if key in _VERDICT_CACHE]
         except Exception as e:
             logger.error(f"Fact-checking failed: {str(e)}")
             return []
+
+    @retry_async()
+    async def _extract_claims(self, transcript_chunk: str) -> List[str]:
+        """Ask GPT for the verifiable claims in a transcript chunk."""
+        extract_res = await asyncio.wait_for(
+            self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": "Extract 2-3 specific factual or numeric claims from the following transcript that should be verified. Return as a JSON array of strings under a 'claims' key."},
+                    {"role": "user", "content": f"TRANSCRIPT: {transcript_chunk}"}
+                ],
+                response_format={ "type": "json_object" },
+                max_tokens=256
+            ),
+            timeout=TIMEOUTS.llm_standard
+        )
+        
+        claims_data = json.loads(extract_res.choices[0].message.content)
+        claims = claims_data.get("claims", [])
+        
+        if not claims:
+            # Fallback if the model didn't use the 'claims' key correctly
+            if isinstance(claims_data, dict) and len(claims_data) > 0:
+                claims = list(claims_data.values())[0] if isinstance(list(claims_data.values())[0], list) else []
+        
+        return claims
+
+    @retry_async()
+    async def _search_claim_context(self, claim: str) -> str:
+        """Search Tavily for evidence on a single claim."""
+        logger.info(f"Verifying claim: {claim}")
+        search_query = f"is it true that {claim}"
+        search_result = await self.tavily_async.search(query=search_query, search_depth="basic", max_results=2)
+        
+        return "".join(f"{res['content']}\n" for res in search_result.get("results", []))
+
+    @retry_async()
+    async def _verify_claims(self, claims_with_context: List[Tuple[str, str]]) -> List[Dict]:
+        """
+        Ask GPT for verdicts on several claims in a single request.
+        
+        Args:
+            claims_with_context: List of (claim, search context) pairs
+            
+        Returns:
+            One verdict dict per claim, in the same order
+        """
+        payload = json.dumps({
+            "claims": [{"claim": claim, "context": context} for claim, context in claims_with_context]
+        })
+        
+        verify_res = await asyncio.wait_for(
+            self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": "Verify each claim based on its search context. For each claim, in the order given, return a verdict (Correct, Misleading, or Incorrect) and a 1-sentence explanation. Output JSON {'results': [{'verdict': '...', 'explanation': '...'}, ...]}."},
+                    {"role": "user", "content": payload}
+                ],
+                response_format={ "type": "json_object" },
+                max_tokens=256 * len(claims_with_context)
+            ),
+            timeout=TIMEOUTS.llm_standard
+        )
+        
+        results = json.loads(verify_res.choices[0].message.content).get("results", [])
+        
+        verdicts = []
+        for i, (claim, _) in enumerate(claims_with_context):
+            v_data = results[i] if i < len(results) and isinstance(results[i], dict) else {}
+            verdicts.append({
+                "claim": claim,
+                "verdict": v_data.get("verdict", "Inconclusive"),
+                "explanation": v_data.get("explanation", "Could not verify claim.")
+            })
+        return verdicts
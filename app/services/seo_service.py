@@ -4,12 +4,30 @@ Grades articles against SEO best practices and can auto-optimize.
 """
 
 import re
+import hashlib
 import logging
+from functools import lru_cache
 from typing import Optional
 from dataclasses import dataclass
 
+from cachetools import LRUCache
+
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import
+_SENT_RE = re.compile(r'[.!?]+')
+_CONCL_RE = re.compile(r'##?\s*(conclusion|wrap|summary|final)', re.I)
+# Union of the CTA phrases (substring match, as with the old per-phrase search)
+_CTA_RE = re.compile(r'subscribe|sign up|download|learn more|get started|join|contact|try|read more', re.I)
+_H1_PREFIX_RE = re.compile(r'^#\s*')
+# Same test as content.strip().startswith('# ') without copying the article
+_H1_START_RE = re.compile(r'\s*# \s*\S')
+_KW_WORDS_RE = re.compile(r'\b[a-z]{4,}\b')
+
+# Scores keyed by (content digest, keyword); the optimize loop re-scores
+# the same draft, and the pipeline scores each blog post more than once
+_SCORE_CACHE: LRUCache = LRUCache(maxsize=128)
+
 
 @dataclass
 class SEOScore:
@@ -56,12 +74,44 @@ class SEOService:
         feedback = []
         details = {}
         
+        lines = content.split('\n')
+        
         # Auto-extract keyword if not provided
         if not keyword:
-            keyword = self._extract_likely_keyword(content)
+            keyword = self._extract_likely_keyword(lines[0])
+        
+        # Single sweep over the lines: word tally, H2s, sentence breaks and
+        # paragraph lengths (paragraphs end at blank lines)
+        word_count = 0
+        total_word_len = 0
+        first_100_words = []
+        h2_count = 0
+        sentence_breaks = 0
+        para_words = 0
+        long_paragraphs = 0
+        for line in lines:
+            if not line:
+                if para_words > 150:
+                    long_paragraphs += 1
+                para_words = 0
+                continue
+            
+            tokens = line.split()
+            n_tokens = len(tokens)
+            word_count += n_tokens
+            para_words += n_tokens
+            total_word_len += sum(map(len, tokens))
+            if len(first_100_words) < 100:
+                first_100_words.extend(tokens[:100 - len(first_100_words)])
+            
+            if line.startswith('## '):
+                h2_count += 1
+            sentence_breaks += len(_SENT_RE.findall(line))
+        if para_words > 150:
+            long_paragraphs += 1
         
         # 1. Check H1
-        has_h1 = content.strip().startswith("# ")
+        has_h1 = _H1_START_RE.match(content) is not None
         if has_h1:
             score += self.RUBRIC["has_h1"]["points"]
             details["has_h1"] = True
@@ -70,7 +120,6 @@ class SEOService:
             details["has_h1"] = False
         
         # 2. Check H2s
-        h2_count = len(re.findall(r'^## ', content, re.MULTILINE))
         if h2_count >= 3:
             score += self.RUBRIC["has_h2s"]["points"]
             details["h2_count"] = h2_count
@@ -79,7 +128,6 @@ class SEOService:
             details["h2_count"] = h2_count
         
         # 3. Word count
-        word_count = len(content.split())
         if 800 <= word_count <= 1500:
             score += self.RUBRIC["word_count_ok"]["points"]
             details["word_count"] = word_count
@@ -91,9 +139,9 @@ class SEOService:
             details["word_count"] = word_count
         
         # 4. Reading level (simplified check)
-        avg_word_length = sum(len(w) for w in content.split()) / max(word_count, 1)
-        sentences = re.split(r'[.!?]+', content)
-        avg_sentence_length = word_count / max(len(sentences), 1)
+        avg_word_length = total_word_len / max(word_count, 1)
+        sentence_count = sentence_breaks + 1
+        avg_sentence_length = word_count / sentence_count
         
         # Flesch-Kincaid approximation
         grade_level = 0.39 * avg_sentence_length + 11.8 * (avg_word_length / 4.5) - 15.59
@@ -107,7 +155,7 @@ class SEOService:
         
         # 5. Keyword in title
         if keyword:
-            first_line = content.split('\n')[0].lower()
+            first_line = lines[0].lower()
             if keyword.lower() in first_line:
                 score += self.RUBRIC["keyword_in_title"]["points"]
                 details["keyword_in_title"] = True
@@ -116,7 +164,7 @@ class SEOService:
                 details["keyword_in_title"] = False
             
             # 6. Keyword in first 100 words
-            first_100 = ' '.join(content.split()[:100]).lower()
+            first_100 = ' '.join(first_100_words).lower()
             if keyword.lower() in first_100:
                 score += self.RUBRIC["keyword_in_first_100"]["points"]
                 details["keyword_early"] = True
@@ -125,7 +173,7 @@ class SEOService:
                 details["keyword_early"] = False
         
         # 7. Has conclusion
-        has_conclusion = bool(re.search(r'##?\s*(conclusion|wrap|summary|final)', content, re.I))
+        has_conclusion = bool(_CONCL_RE.search(content))
         if has_conclusion:
             score += self.RUBRIC["has_conclusion"]["points"]
             details["has_conclusion"] = True
@@ -134,11 +182,7 @@ class SEOService:
             details["has_conclusion"] = False
         
         # 8. Has CTA
-        cta_patterns = [
-            r'subscribe', r'sign up', r'download', r'learn more',
-            r'get started', r'join', r'contact', r'try', r'read more'
-        ]
-        has_cta = any(re.search(p, content, re.I) for p in cta_patterns)
+        has_cta = bool(_CTA_RE.search(content))
         if has_cta:
             score += self.RUBRIC["has_cta"]["points"]
             details["has_cta"] = True
@@ -147,8 +191,6 @@ class SEOService:
             details["has_cta"] = False
         
         # 9. Short paragraphs
-        paragraphs = re.split(r'\n\n+', content)
-        long_paragraphs = sum(1 for p in paragraphs if len(p.split()) > 150)
         if long_paragraphs == 0:
             score += self.RUBRIC["short_paragraphs"]["points"]
             details["short_paragraphs"] = True
@@ -175,14 +217,29 @@ class SEOService:
             details=details
         )
     
-    def _extract_likely_keyword(self, content: str) -> str:
-        """Extract the most likely target keyword from content."""
-        # Get first H1 or first line
-        first_line = content.split('\n')[0]
-        first_line = re.sub(r'^#\s*', '', first_line)  # Remove markdown heading
+    def score_article_cached(self, content: str, keyword: Optional[str] = None) -> SEOScore:
+        """
+        Memoized score_article, keyed by a digest of the content.
+        
+        The returned SEOScore is shared between callers; treat it as read-only.
+        """
+        content_hash = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        cache_key = (content_hash, keyword)
+        
+        result = _SCORE_CACHE.get(cache_key)
+        if result is None:
+            result = self.score_article(content, keyword)
+            _SCORE_CACHE[cache_key] = result
+        return result
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _extract_likely_keyword(first_line: str) -> str:
+        """Extract the most likely target keyword from the article's first line."""
+        first_line = _H1_PREFIX_RE.sub('', first_line)  # Remove markdown heading
         
         # Get significant words
-        words = re.findall(r'\b[a-z]{4,}\b', first_line.lower())
+        words = _KW_WORDS_RE.findall(first_line.lower())
         
         # Filter common words
         stop_words = {'this', 'that', 'with', 'from', 'your', 'have', 'will', 'what', 'when', 'where', 'about'}
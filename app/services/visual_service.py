@@ -3,19 +3,303 @@ import logging
 import json
 import asyncio
 import base64
+import multiprocessing
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
-import requests
+from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup
 from PIL import Image, ImageDraw, ImageFont
-import img2pdf
 from playwright.async_api import async_playwright
-from openai import AsyncOpenAI
+import onnxruntime as ort
 from rembg import remove
+from rembg.sessions.u2net_custom import U2netCustomSession
+from rembg.sessions.u2netp import U2netpSession
+
+from app.utils.http_client import get_http_client
+from app.utils.openai_client import TIMEOUTS, get_openai_client
+from app.utils.retry import retry_async
 
 logger = logging.getLogger(__name__)
 
+# u2netp is the lightweight U²-Net variant; plenty for headshot cutouts
+REMBG_MODEL = "u2netp"
+
+# int8 copy of u2netp, produced once offline with
+#   onnxruntime.quantization.quantize_dynamic(
+#       "u2netp.onnx", "u2netp.int8.onnx", weight_type=QuantType.QInt8)
+# Used when present, otherwise we fall back to the FP32 model.
+REMBG_INT8_MODEL_PATH = Path(os.getenv("U2NET_HOME", Path.home() / ".u2net")) / "u2netp.int8.onnx"
+
+# ORT threads per worker; 3 thumbnail workers x 2 threads avoids oversubscribing the CPU
+REMBG_THREADS = 2
+
+# rembg session, created at most once per worker process
+_REMBG_SESSION = None
+
+
+def _get_rembg_session():
+    """Load the rembg model on first use in this process and reuse it after."""
+    global _REMBG_SESSION
+    if _REMBG_SESSION is None:
+        sess_opts = ort.SessionOptions()
+        sess_opts.intra_op_num_threads = REMBG_THREADS
+        
+        if REMBG_INT8_MODEL_PATH.exists():
+            _REMBG_SESSION = U2netCustomSession(
+                "u2net_custom",
+                sess_opts,
+                providers=["CPUExecutionProvider"],
+                model_path=str(REMBG_INT8_MODEL_PATH)
+            )
+        else:
+            _REMBG_SESSION = U2netpSession(REMBG_MODEL, sess_opts, providers=["CPUExecutionProvider"])
+    return _REMBG_SESSION
+
+
+def _composite_thumbnail(
+    img_b64: str,
+    user_image_path: Optional[str],
+    overlay_text: str,
+    font_path: Optional[str],
+    output_path: str
+) -> None:
+    """
+    Decode and resize the base image, paste the face cutout, draw the text
+    and save. Runs in a _PPOOL worker process.
+    """
+    base_img = Image.open(BytesIO(base64.b64decode(img_b64))).resize(
+        (1280, 720), Image.Resampling.LANCZOS
+    )
+    
+    # 2. Add User Face Cutout (Optional)
+    if user_image_path and os.path.exists(user_image_path):
+        try:
+            with open(user_image_path, "rb") as i:
+                input_img = i.read()
+                output_img = remove(input_img, session=_get_rembg_session())
+                face_cutout = Image.open(BytesIO(output_img))
+                
+                # Resize and paste face
+                face_cutout.thumbnail((600, 600))
+                base_img.paste(face_cutout, (20, 120), face_cutout)
+        except Exception as e:
+            logger.warning(f"Failed to process face cutout: {str(e)}")
+
+    # 3. Add Massive Bold Text with Pillow
+    draw = ImageDraw.Draw(base_img)
+    
+    # Try to find a thick font
+    font_size = 180
+    try:
+        if font_path:
+            font = ImageFont.truetype(font_path, font_size)
+        else:
+            font = ImageFont.load_default()
+    except:
+        font = ImageFont.load_default()
+        
+    # Native stroke for readability (rasterized once, in C); anchor "mm"
+    # centers the text on the point but needs a FreeType font
+    anchor = "mm" if isinstance(font, ImageFont.FreeTypeFont) else None
+    draw.text(
+        (800, 450), overlay_text, font=font, fill="yellow",
+        stroke_width=8, stroke_fill="black", anchor=anchor
+    )
+    
+    base_img.save(output_path)
+
+
+# One worker per thumbnail variant; processes start lazily on first submit.
+# Spawned, not forked: forking a threaded server (uvicorn, to_thread pool,
+# Playwright) can leave a child deadlocked on a lock held at fork time.
+_PPOOL = ProcessPoolExecutor(max_workers=3, mp_context=multiprocessing.get_context("spawn"))
+
+
+def shutdown_process_pool() -> None:
+    """Stop the thumbnail worker processes (app shutdown)."""
+    _PPOOL.shutdown(wait=True, cancel_futures=True)
+
+# Chromium is launched once and kept alive; each carousel gets a cheap context
+_PLAYWRIGHT = None
+_PLAYWRIGHT_BROWSER = None
+_PLAYWRIGHT_LOOP = None
+# asyncio locks bind to the loop that first contends them, so each loop gets its own
+_PLAYWRIGHT_LOCKS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def _loop_lock(locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]") -> asyncio.Lock:
+    """Return the lock in `locks` for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    lock = locks.get(loop)
+    if lock is None:
+        lock = locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def _stop_playwright(playwright, browser) -> None:
+    """Close a browser and stop its Playwright driver."""
+    try:
+        if browser is not None:
+            await browser.close()
+    finally:
+        if playwright is not None:
+            await playwright.stop()
+
+
+def _kill_playwright_driver(playwright) -> None:
+    """
+    Kill the driver of a Playwright instance whose event loop has stopped and
+    can no longer run a clean shutdown. Chromium exits with it, as its
+    control pipe closes.
+    """
+    # Playwright has no public sync kill; this reaches the driver subprocess
+    # through private attributes, so a Playwright upgrade may move it
+    try:
+        proc = playwright._impl_obj._connection._transport._proc
+    except AttributeError:
+        logger.warning("Could not find the orphaned Playwright driver process; leaving it running")
+        return
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        pass  # Already exited
+
+
+async def _get_browser():
+    """Return the shared Chromium browser, launching it on first use."""
+    global _PLAYWRIGHT, _PLAYWRIGHT_BROWSER, _PLAYWRIGHT_LOOP
+    
+    loop = asyncio.get_running_loop()
+    async with _loop_lock(_PLAYWRIGHT_LOCKS):
+        if _PLAYWRIGHT_BROWSER is None or _PLAYWRIGHT_LOOP is not loop or not _PLAYWRIGHT_BROWSER.is_connected():
+            # Release the instance being replaced before launching a new one
+            if _PLAYWRIGHT is not None:
+                if _PLAYWRIGHT_LOOP is loop:
+                    try:
+                        await _stop_playwright(_PLAYWRIGHT, _PLAYWRIGHT_BROWSER)
+                    except Exception as e:
+                        logger.warning(f"Error stopping disconnected browser: {e}")
+                elif _PLAYWRIGHT_LOOP.is_running():
+                    # Renders on that loop may still be using it
+                    logger.info("Replaced browser is still in use on another event loop; not closing it")
+                else:
+                    _kill_playwright_driver(_PLAYWRIGHT)
+            
+            _PLAYWRIGHT = await async_playwright().start()
+            _PLAYWRIGHT_BROWSER = await _PLAYWRIGHT.chromium.launch(
+                args=["--no-sandbox", "--disable-dev-shm-usage"]
+            )
+            _PLAYWRIGHT_LOOP = loop
+            logger.info("Launched shared Chromium browser")
+    return _PLAYWRIGHT_BROWSER
+
+
+async def close_browser() -> None:
+    """Close the shared browser and stop Playwright (app shutdown)."""
+    global _PLAYWRIGHT, _PLAYWRIGHT_BROWSER, _PLAYWRIGHT_LOOP
+    
+    await _stop_playwright(_PLAYWRIGHT, _PLAYWRIGHT_BROWSER)
+    _PLAYWRIGHT = None
+    _PLAYWRIGHT_BROWSER = None
+    _PLAYWRIGHT_LOOP = None
+
+# Carousel fonts (OFL variable TTFs, every weight in one file). Read from
+# CAROUSEL_FONT_DIR, which can be pre-populated to vendor them; missing files
+# are downloaded there once. They're inlined as base64 @font-face rules, so
+# renders never fetch fonts.
+CAROUSEL_FONT_DIR = Path(os.getenv("CAROUSEL_FONT_DIR", Path.home() / ".cache" / "omni_core" / "fonts"))
+CAROUSEL_FONT_URLS = {
+    "Inter": "https://raw.githubusercontent.com/google/fonts/main/ofl/inter/Inter%5Bopsz,wght%5D.ttf",
+    "Orbitron": "https://raw.githubusercontent.com/google/fonts/main/ofl/orbitron/Orbitron%5Bwght%5D.ttf",
+}
+FONT_DOWNLOAD_TIMEOUT = 10.0
+# After a failed download, renders use the Google Fonts <link> without
+# retrying for this many seconds (egress-restricted deployments)
+FONT_RETRY_COOLDOWN = 300.0
+_FONT_LOCKS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+_FONT_FAILED_AT: Optional[float] = None
+
+
+def _font_path(family: str) -> Path:
+    return CAROUSEL_FONT_DIR / f"{family}.ttf"
+
+
+def _read_font_files() -> Dict[str, bytes]:
+    """Return the carousel fonts already in CAROUSEL_FONT_DIR, by family."""
+    fonts = {}
+    for family in CAROUSEL_FONT_URLS:
+        try:
+            fonts[family] = _font_path(family).read_bytes()
+        except FileNotFoundError:
+            pass
+    return fonts
+
+
+def _write_font_file(family: str, data: bytes) -> None:
+    """Atomically store a downloaded font (safe with concurrent workers)."""
+    path = _font_path(family)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+async def _load_carousel_font_css() -> Optional[str]:
+    """
+    Return @font-face rules with the carousel fonts inlined, downloading any
+    that aren't on disk yet. None if they can't be fetched.
+    """
+    global _FONT_FAILED_AT
+    
+    fonts = await asyncio.to_thread(_read_font_files)
+    missing = [family for family in CAROUSEL_FONT_URLS if family not in fonts]
+    if missing:
+        if _FONT_FAILED_AT is not None and time.monotonic() - _FONT_FAILED_AT < FONT_RETRY_COOLDOWN:
+            return None
+        
+        client = get_http_client()
+        try:
+            responses = await asyncio.gather(*[
+                client.get(CAROUSEL_FONT_URLS[family], timeout=FONT_DOWNLOAD_TIMEOUT, follow_redirects=True)
+                for family in missing
+            ])
+            for response in responses:
+                response.raise_for_status()
+        except Exception as e:
+            _FONT_FAILED_AT = time.monotonic()
+            logger.warning(f"Could not download carousel fonts, retrying in {FONT_RETRY_COOLDOWN:.0f}s: {e}")
+            return None
+        
+        _FONT_FAILED_AT = None
+        for family, response in zip(missing, responses):
+            fonts[family] = response.content
+            await asyncio.to_thread(_write_font_file, family, response.content)
+        logger.info(f"Cached carousel fonts in {CAROUSEL_FONT_DIR}")
+    
+    return "\n".join(
+        f"@font-face {{ font-family: '{family}'; font-weight: 100 900; font-display: block; "
+        f"src: url(data:font/ttf;base64,{base64.b64encode(data).decode('ascii')}) format('truetype'); }}"
+        for family, data in fonts.items()
+    )
+
+
+# Jinja2 environment for the carousel templates (compiled templates are cached on it)
+_JINJA_ENV: Optional[Environment] = None
+
+
+def _get_jinja_env(templates_dir: Path) -> Environment:
+    """Create the autoescaping template environment on first use."""
+    global _JINJA_ENV
+    if _JINJA_ENV is None:
+        _JINJA_ENV = Environment(loader=FileSystemLoader(str(templates_dir)), autoescape=True)
+    return _JINJA_ENV
+
+
 class VisualIntelligenceService:
     """
     Phase 1: Visual Intelligence (The Eye)
@@ -24,10 +308,16 @@ class VisualIntelligenceService:
     
     OUTPUT_DIR = Path("./data/visuals")
     TEMPLATES_DIR = Path("./app/templates/visuals")
+    # Only used when the fonts can't be downloaded for inlining
+    GOOGLE_FONTS_LINK = '<link href="https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700&family=Inter:wght@400;700&display=swap" rel="stylesheet">'
+    
+    # Built once per process: the static <head> and the per-style CSS
+    _HEAD_CACHE: Optional[str] = None
+    _CSS_CACHE: Dict[str, str] = {}
     
     def __init__(self):
         self.api_key = os.getenv("OPENAI_API_KEY")
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client()
         
         # Ensure directories exist
         self.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -37,77 +327,87 @@ class VisualIntelligenceService:
         self.bold_font_path = "/System/Library/Fonts/Supplemental/Arial Bold.ttf"
         if not os.path.exists(self.bold_font_path):
             self.bold_font_path = None # Fallback to default
+        
+        # Compiled once by the shared environment, then reused
+        self._carousel_tmpl = _get_jinja_env(self.TEMPLATES_DIR).get_template("carousel.html.j2")
             
     # --- LinkedIn Carousel Factory ---
     
+    # Cyberpunk colors: Cyan (#00f3ff), Magenta (#ff00ff), Yellow (#ffff00)
+    # Minimalist: White/Black/Gray
+    # Corporate: Blue/Navy/White
+    CAROUSEL_STYLES = {
+        "cyberpunk": {
+            "bg": "radial-gradient(circle, #0d0d0d 0%, #000000 100%)",
+            "text": "#ffffff",
+            "accent": "#00f3ff",
+            "secondary": "#ff00ff",
+            "border": "2px solid #00f3ff"
+        },
+        "minimalist": {
+            "bg": "#ffffff",
+            "text": "#000000",
+            "accent": "#666666",
+            "secondary": "#999999",
+            "border": "1px solid #000000"
+        },
+        "corporate": {
+            "bg": "#f4f7f9",
+            "text": "#1a365d",
+            "accent": "#3182ce",
+            "secondary": "#2c5282",
+            "border": "5px solid #3182ce"
+        }
+    }
+    
     async def batch_generate_carousels(self, client_id: str, title: str, slides: List[str], styles: List[str]) -> Dict[str, dict]:
         """
-        Generate multiple carousel styles in parallel using a SINGLE browser instance.
-        This is much faster and lighter than launching 3 separate browsers.
+        Generate multiple carousel styles from a SINGLE rendered page.
+        All styles are laid out in one HTML document, rendered once and
+        captured with one screenshot, then cropped per slide. PDFs are
+        printed by Chromium directly, one per style.
         """
         logger.info(f"Batch generating carousels for {client_id} with styles: {styles}")
         
         results = {}
         
-        # Pre-generate HTMLs (fast, CPU only)
-        html_tasks = []
-        for style in styles:
-            html_template = self._get_carousel_template(title, slides, style)
-            temp_html_path = self.OUTPUT_DIR / f"carousel_{client_id}_{style}.html"
-            with open(temp_html_path, "w") as f:
-                f.write(html_template)
-            html_tasks.append((style, temp_html_path))
-
-        async with async_playwright() as p:
-            # 1. Launch ONE Browser (Heavy op)
-            browser = await p.chromium.launch()
+        head = await self._get_carousel_head()
+        html_template = self._get_carousel_template(head, [(style, title, slides) for style in styles])
+
+        browser = await _get_browser()
+        context = await browser.new_context(viewport={"width": 1080, "height": 1080})
+        try:
+            page = await context.new_page()
+            await page.set_content(html_template, wait_until="load")
+            
+            # Wait for render
+            await page.wait_for_selector(f"#slide-{styles[0]}-0", state="visible")
+            await page.evaluate("document.fonts.ready.then(() => true)")
             
-            # 2. Create parallel pages context (Light op)
-            async def process_style(style, html_path):
+            slide_paths = await self._capture_slides(page, client_id)
+            
+            for style in styles:
                 try:
-                    page = await browser.new_page(viewport={"width": 1080, "height": 1080})
-                    await page.goto(f"file://{html_path.absolute()}")
-                    
-                    # Wait for render
-                    await page.wait_for_selector("#slide-0", state="visible")
-                    await page.wait_for_timeout(300) # Jitter wait
-                    
-                    image_paths = []
-                    for i in range(len(slides) + 2):
-                        slide_id = f"#slide-{i}"
-                        slide_path = self.OUTPUT_DIR / f"slide_{client_id}_{style}_{i}.png"
-                        
-                        element = await page.query_selector(slide_id)
-                        if element:
-                            await element.screenshot(path=str(slide_path))
-                            image_paths.append(str(slide_path))
-                        
-                    await page.close()
-                    
+                    image_paths = slide_paths.get(style, [])
                     if not image_paths:
                         raise ValueError("No slides generated")
-                        
-                    # Merge to PDF
+                    
                     output_pdf_path = self.OUTPUT_DIR / f"carousel_{client_id}_{style}.pdf"
-                    with open(output_pdf_path, "wb") as f:
-                        f.write(img2pdf.convert(image_paths))
-                        
-                    return {
+                    await self._render_pdf(page, style, output_pdf_path)
+                    
+                    results[style] = {
                         "pdf": f"/data/visuals/{output_pdf_path.name}",
                         "images": [f"/data/visuals/{Path(p).name}" for p in image_paths]
                     }
                 except Exception as e:
                     logger.error(f"Error processing style {style}: {e}")
-                    return {"error": str(e)}
-
-            # 3. Run all pages in parallel
-            tasks = [process_style(style, path) for style, path in html_tasks]
-            batch_results = await asyncio.gather(*tasks)
-            
-            for style, res in zip(styles, batch_results):
-                results[style] = res
-                
-            await browser.close()
+                    results[style] = {"error": str(e)}
+        except Exception as e:
+            logger.error(f"Batch carousel render failed: {e}")
+            for style in styles:
+                results.setdefault(style, {"error": str(e)})
+        finally:
+            await context.close()
             
         return results
 
@@ -126,52 +426,37 @@ class VisualIntelligenceService:
         """
         logger.info(f"Generating LinkedIn carousel for {client_id} with style {style}")
         
-        # 1. Create temporary HTML file with the branded template
-        html_template = self._get_carousel_template(title, slides, style)
+        # 1. Build the branded HTML (rendered from memory, no temp file)
+        head = await self._get_carousel_head()
+        html_template = self._get_carousel_template(head, [(style, title, slides)])
         import uuid
         unique_id = f"{client_id}_{style}_{uuid.uuid4().hex[:8]}"
-        temp_html_path = self.OUTPUT_DIR / f"carousel_{unique_id}.html"
-        
-        with open(temp_html_path, "w") as f:
-            f.write(html_template)
             
         # 2. Use Playwright to take screenshots of each slide
         output_pdf_path = self.OUTPUT_DIR / f"carousel_{unique_id}.pdf"
-        image_paths = []
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page(viewport={"width": 1080, "height": 1080})
-            await page.goto(f"file://{temp_html_path.absolute()}")
+        browser = await _get_browser()
+        context = await browser.new_context(viewport={"width": 1080, "height": 1080})
+        try:
+            page = await context.new_page()
+            await page.set_content(html_template, wait_until="load")
             
             # Wait for any animations/rendering - wait for the first slide to be visible
-            await page.wait_for_selector("#slide-0", state="visible")
+            await page.wait_for_selector(f"#slide-{style}-0", state="visible")
             
-            # Small jitter wait for fonts/styles
-            await page.wait_for_timeout(300)
-            
-            for i in range(len(slides) + 2): # Cover + Content Slides + Conclusion
-                slide_id = f"#slide-{i}"
-                # Fix: Include style in filename to prevent parallel processes overwriting each other's screenshots
-                slide_path = self.OUTPUT_DIR / f"slide_{client_id}_{style}_{i}.png"
-                
-                element = await page.query_selector(slide_id)
-                if element:
-                    await element.screenshot(path=str(slide_path))
-                    image_paths.append(str(slide_path))
-                
-            await browser.close()
+            # Wait until every font face has loaded
+            await page.evaluate("document.fonts.ready.then(() => true)")
             
-        if not image_paths:
-            raise ValueError(f"Failed to generate any slides for style {style}. Check HTML rendering.")
+            slide_paths = await self._capture_slides(page, client_id)
             
-        # 3. Merge PNGs into PDF
-        with open(output_pdf_path, "wb") as f:
-            f.write(img2pdf.convert(image_paths))
+            image_paths = slide_paths.get(style, [])
+            if not image_paths:
+                raise ValueError(f"Failed to generate any slides for style {style}. Check HTML rendering.")
             
-        # Cleanup
-        if os.path.exists(temp_html_path):
-            os.remove(temp_html_path)
+            # 3. Print the PDF straight from the rendered page
+            await self._render_pdf(page, style, output_pdf_path)
+        finally:
+            await context.close()
             
         logger.info(f"Carousel generated at {output_pdf_path}")
         return {
@@ -179,108 +464,183 @@ class VisualIntelligenceService:
             "images": [f"/data/visuals/{Path(p).name}" for p in image_paths]
         }
 
-    def _get_carousel_template(self, title: str, slides: List[str], style: str) -> str:
-        """Helper to generate HTML/CSS for the carousel."""
-        # Cyberpunk colors: Cyan (#00f3ff), Magenta (#ff00ff), Yellow (#ffff00)
-        # Minimalist: White/Black/Gray
-        # Corporate: Blue/Navy/White
+    async def _capture_slides(self, page, client_id: str) -> Dict[str, List[str]]:
+        """
+        Capture every rendered slide as a PNG.
+        Reads all slide boxes in one call, takes one full-page screenshot and
+        crops it locally instead of one screenshot round-trip per slide; the
+        crops are encoded to PNG concurrently.
         
-        styles = {
-            "cyberpunk": {
-                "bg": "radial-gradient(circle, #0d0d0d 0%, #000000 100%)",
-                "text": "#ffffff",
-                "accent": "#00f3ff",
-                "secondary": "#ff00ff",
-                "border": "2px solid #00f3ff"
-            },
-            "minimalist": {
-                "bg": "#ffffff",
-                "text": "#000000",
-                "accent": "#666666",
-                "secondary": "#999999",
-                "border": "1px solid #000000"
-            },
-            "corporate": {
-                "bg": "#f4f7f9",
-                "text": "#1a365d",
-                "accent": "#3182ce",
-                "secondary": "#2c5282",
-                "border": "5px solid #3182ce"
-            }
-        }
+        Returns:
+            Mapping of style -> ordered slide PNG paths
+        """
+        boxes = await page.locator(".slide").evaluate_all(
+            """els => els.map(el => {
+                const r = el.getBoundingClientRect();
+                return {
+                    style: el.dataset.style,
+                    index: Number(el.dataset.index),
+                    x: r.left + window.scrollX,
+                    y: r.top + window.scrollY,
+                    w: r.width,
+                    h: r.height
+                };
+            })"""
+        )
+        if not boxes:
+            return {}
         
-        s = styles.get(style, styles["cyberpunk"])
+        screenshot = await page.screenshot(full_page=True)
         
-        # Build HTML with each slide as a div
-        slides_html = []
+        def decode() -> Image.Image:
+            full = Image.open(BytesIO(screenshot))
+            full.load()
+            return full
         
-        # Cover Slide
-        slides_html.append(f"""
-            <div id="slide-0" class="slide cover">
-                <div class="glow"></div>
-                <h1 style="color: {s['accent']}">{title}</h1>
-                <p>A Deep Dive with Omni-Core Agent</p>
-                <div class="footer">SWIPE LEFT &rarr;</div>
-            </div>
-        """)
+        full = await asyncio.to_thread(decode)
         
-        # Content Slides
-        for i, text in enumerate(slides):
-            slides_html.append(f"""
-                <div id="slide-{i+1}" class="slide content">
-                    <div class="number">{i+1}</div>
-                    <div class="card">
-                        <p>{text}</p>
-                    </div>
-                </div>
-            """)
-            
-        # Conclusion Slide
-        slides_html.append(f"""
-            <div id="slide-{len(slides)+1}" class="slide conclusion">
-                <h2 style="color: {s['secondary']}">Ready to Scale?</h2>
-                <p>Check the link in comments for the full video.</p>
-                <div class="cta">LIKE &bull; REPOST &bull; FOLLOW</div>
-            </div>
-        """)
+        def save_slide(box: dict) -> str:
+            # Fix: Include style in filename to prevent parallel processes overwriting each other's screenshots
+            slide_path = self.OUTPUT_DIR / f"slide_{client_id}_{box['style']}_{box['index']}.png"
+            x, y = round(box["x"]), round(box["y"])
+            full.crop((x, y, x + round(box["w"]), y + round(box["h"]))).save(slide_path)
+            return str(slide_path)
+        
+        # PNG encoding releases the GIL, so the slides compress in parallel
+        saved = await asyncio.gather(*[asyncio.to_thread(save_slide, box) for box in boxes])
+        full.close()
         
-        full_html = f"""
+        paths: Dict[str, List[str]] = {}
+        for box, slide_path in zip(boxes, saved):
+            paths.setdefault(box["style"], []).append(slide_path)
+        return paths
+
+    async def _render_pdf(self, page, style: str, output_pdf_path: Path) -> None:
+        """
+        Print one style's slides to PDF, one 1080x1080 page per slide.
+        Marks that style's section as the print target so the print
+        stylesheet hides the others.
+        """
+        await page.evaluate(
+            """style => document.querySelectorAll('.carousel').forEach(
+                el => el.classList.toggle('print-target', el.id === `carousel-${style}`)
+            )""",
+            style
+        )
+        await page.pdf(
+            path=str(output_pdf_path),
+            width="1080px",
+            height="1080px",
+            print_background=True,
+            prefer_css_page_size=True
+        )
+
+    async def _get_carousel_head(self) -> str:
+        """
+        Return the carousel <head>, built once per process with the fonts
+        inlined. The Google Fonts fallback isn't cached, so a render after
+        FONT_RETRY_COOLDOWN retries the download.
+        """
+        if VisualIntelligenceService._HEAD_CACHE is None:
+            async with _loop_lock(_FONT_LOCKS):
+                if VisualIntelligenceService._HEAD_CACHE is None:
+                    font_css = await _load_carousel_font_css()
+                    if font_css is None:
+                        return self._build_carousel_head(None)
+                    VisualIntelligenceService._HEAD_CACHE = self._build_carousel_head(font_css)
+        return VisualIntelligenceService._HEAD_CACHE
+
+    def _build_carousel_head(self, font_css: Optional[str]) -> str:
+        """
+        Build the static <head> shared by every carousel render.
+        With font_css (base64 @font-face rules) Chromium never fetches fonts
+        over the network; without it we fall back to the Google Fonts stylesheet.
+        """
+        font_link = "" if font_css else self.GOOGLE_FONTS_LINK
+        font_css = font_css or ""
+        
+        return f"""
         <!DOCTYPE html>
         <html>
         <head>
-            <link href="https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700&family=Inter:wght@400;700&display=swap" rel="stylesheet">
+            {font_link}
             <style>
+                {font_css}
                 body {{ margin: 0; padding: 0; font-family: 'Inter', sans-serif; }}
+                .carousel {{ display: flex; width: max-content; }}
                 .slide {{ 
                     width: 1080px; 
                     height: 1080px; 
+                    flex-shrink: 0;
                     display: flex; 
                     flex-direction: column; 
                     justify-content: center; 
                     align-items: center; 
                     padding: 80px; 
                     box-sizing: border-box;
-                    background: {s['bg']};
-                    color: {s['text']};
                     position: relative;
                     overflow: hidden;
                 }}
-                h1 {{ font-family: 'Orbitron', sans-serif; font-size: 84px; text-transform: uppercase; text-align: center; margin-bottom: 20px; text-shadow: 0 0 20px {s['accent']}44; }}
+                h1 {{ font-family: 'Orbitron', sans-serif; font-size: 84px; text-transform: uppercase; text-align: center; margin-bottom: 20px; }}
                 h2 {{ font-size: 64px; text-transform: uppercase; }}
                 p {{ font-size: 42px; line-height: 1.4; text-align: center; max-width: 800px; }}
-                .number {{ position: absolute; top: 40px; right: 40px; font-size: 120px; font-weight: bold; opacity: 0.1; font-family: 'Orbitron'; color: {s['accent']}; }}
-                .card {{ border: {s['border']}; padding: 60px; border-radius: 24px; background: rgba(255,255,255,0.05); backdrop-filter: blur(10px); }}
-                .glow {{ position: absolute; width: 400px; height: 400px; background: {s['accent']}11; border-radius: 50%; filter: blur(80px); top: -100px; left: -100px; }}
-                .footer {{ position: absolute; bottom: 60px; font-weight: bold; font-family: 'Orbitron'; letter-spacing: 4px; color: {s['secondary']}; }}
+                .number {{ position: absolute; top: 40px; right: 40px; font-size: 120px; font-weight: bold; opacity: 0.1; font-family: 'Orbitron'; }}
+                .card {{ padding: 60px; border-radius: 24px; background: rgba(255,255,255,0.05); backdrop-filter: blur(10px); }}
+                .glow {{ position: absolute; width: 400px; height: 400px; border-radius: 50%; filter: blur(80px); top: -100px; left: -100px; }}
+                .footer {{ position: absolute; bottom: 60px; font-weight: bold; font-family: 'Orbitron'; letter-spacing: 4px; }}
                 .cta {{ margin-top: 40px; font-size: 24px; font-family: 'Orbitron'; opacity: 0.8; letter-spacing: 2px; }}
+                
+                /* PDF output: one slide per page, only the targeted style */
+                @page {{ size: 1080px 1080px; margin: 0; }}
+                @media print {{
+                    .carousel {{ display: none; }}
+                    .carousel.print-target {{ display: block; width: auto; }}
+                    .carousel.print-target .slide:not(:last-child) {{ page-break-after: always; }}
+                }}
             </style>
-        </head>
-        <body>
-            {''.join(slides_html)}
-        </body>
-        </html>
         """
-        return full_html
+
+    def _get_style_css(self, style: str) -> str:
+        """Return the scoped colour rules for a style, built once and cached."""
+        css = self._CSS_CACHE.get(style)
+        if css is None:
+            s = self.CAROUSEL_STYLES.get(style, self.CAROUSEL_STYLES["cyberpunk"])
+            scope = f".style-{style}"
+            css = f"""
+                {scope} .slide {{ background: {s['bg']}; color: {s['text']}; }}
+                {scope} h1 {{ text-shadow: 0 0 20px {s['accent']}44; }}
+                {scope} .number {{ color: {s['accent']}; }}
+                {scope} .card {{ border: {s['border']}; }}
+                {scope} .glow {{ background: {s['accent']}11; }}
+                {scope} .footer {{ color: {s['secondary']}; }}
+            """
+            self._CSS_CACHE[style] = css
+        return css
+
+    def _get_carousel_template(self, head: str, carousels: List[Tuple[str, str, List[str]]]) -> str:
+        """
+        Render the HTML for one or more carousels from carousel.html.j2.
+        The style CSS comes from the per-process cache; slide text is
+        autoescaped by Jinja2.
+        
+        Args:
+            head: Static <head> from _get_carousel_head
+            carousels: List of (style, title, slides). Each style renders as
+                its own row of slides with ids "slide-{style}-{i}".
+        """
+        return self._carousel_tmpl.render(
+            head=Markup(head),
+            style_css=[Markup(self._get_style_css(style)) for style, _, _ in carousels],
+            carousels=[
+                {
+                    "style": style,
+                    "title": title,
+                    "slides": slides,
+                    "s": self.CAROUSEL_STYLES.get(style, self.CAROUSEL_STYLES["cyberpunk"]),
+                }
+                for style, title, slides in carousels
+            ]
+        )
 
     # --- Thumbnail A/B Generator ---
 
@@ -298,17 +658,7 @@ class VisualIntelligenceService:
         logger.info("Generating 3 thumbnail variants via DALL-E 3")
         
         # 1. Ask GPT-4o to describe 3 high-CTR scenes with catchphrases
-        prompts_res = await self.client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "Return a JSON with 3 image prompts and 3 short catchphrases (max 10 chars each). Example: {'variants': [{'prompt': '...', 'text': 'MISTAKE!'}, ...]}"},
-                {"role": "user", "content": f"TRANSCRIPT: {transcript[:2000]}"}
-            ],
-            response_format={ "type": "json_object" }
-        )
-        
-        data = json.loads(prompts_res.choices[0].message.content)
-        variants = data.get("variants", [])[:3]
+        variants = await self._generate_thumbnail_prompts(transcript)
         
         # 2. Parallelize thumbnail generation
         tasks = [
@@ -319,62 +669,53 @@ class VisualIntelligenceService:
         results = await asyncio.gather(*tasks)
         return results
 
+    @retry_async()
+    async def _generate_thumbnail_prompts(self, transcript: str) -> List[Dict]:
+        """Ask GPT-4o for up to 3 {prompt, text} thumbnail variants."""
+        prompts_res = await asyncio.wait_for(
+            self.client.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {"role": "system", "content": "Return a JSON with 3 image prompts and 3 short catchphrases (max 10 chars each). Example: {'variants': [{'prompt': '...', 'text': 'MISTAKE!'}, ...]}"},
+                    {"role": "user", "content": f"TRANSCRIPT: {transcript[:2000]}"}
+                ],
+                response_format={ "type": "json_object" },
+                max_tokens=400
+            ),
+            timeout=TIMEOUTS.llm_standard
+        )
+        
+        data = json.loads(prompts_res.choices[0].message.content)
+        return data.get("variants", [])[:3]
+
+    @retry_async()
+    async def _generate_base_image(self, prompt: str) -> str:
+        """Generate the DALL-E 2 background and return it base64-encoded."""
+        response = await asyncio.wait_for(
+            self.client.images.generate(
+                model="dall-e-2",
+                prompt=f"Cinematic YouTube thumbnail background, high contrast, vibrant: {prompt}. Vivid colors. No text.",
+                n=1,
+                size="512x512", # DALL-E 2 fast generation
+                response_format="b64_json", # Image inline, no second download
+                timeout=TIMEOUTS.image_generation
+            ),
+            timeout=TIMEOUTS.image_generation
+        )
+        return response.data[0].b64_json
+
     async def _generate_single_thumbnail(self, name: str, prompt: str, overlay_text: str, user_image_path: Optional[str]) -> str:
         """Helper to generate and composite a single thumbnail."""
         
         # 1. Generate Base Image via DALL-E 2 (Faster)
-        response = await self.client.images.generate(
-            model="dall-e-2",
-            prompt=f"Cinematic YouTube thumbnail background, high contrast, vibrant: {prompt}. Vivid colors. No text.",
-            n=1,
-            size="512x512" # DALL-E 2 fast generation
-        )
-        
-        image_url = response.data[0].url
-        img_data = requests.get(image_url).content
-        base_img = Image.open(BytesIO(img_data)).resize((1280, 720))
-        
-        # 2. Add User Face Cutout (Optional)
-        if user_image_path and os.path.exists(user_image_path):
-            try:
-                with open(user_image_path, "rb") as i:
-                    input_img = i.read()
-                    output_img = remove(input_img)
-                    face_cutout = Image.open(BytesIO(output_img))
-                    
-                    # Resize and paste face
-                    face_cutout.thumbnail((600, 600))
-                    base_img.paste(face_cutout, (20, 120), face_cutout)
-            except Exception as e:
-                logger.warning(f"Failed to process face cutout: {str(e)}")
-
-        # 3. Add Massive Bold Text with Pillow
-        draw = ImageDraw.Draw(base_img)
-        
-        # Try to find a thick font
-        font_size = 180
-        try:
-            if self.bold_font_path:
-                font = ImageFont.truetype(self.bold_font_path, font_size)
-            else:
-                font = ImageFont.load_default()
-        except:
-            font = ImageFont.load_default()
-            
-        # Add stroke for readability
-        text_pos = (640, 360) # Center-ish
-        # Calculate text size to center it properly
-        # For simplicity, we just draw at a fixed spot or right-aligned
-        
-        # Draw stroke
-        stroke_width = 8
-        for offset in range(-stroke_width, stroke_width + 1):
-            draw.text((800 + offset, 450), overlay_text, font=font, fill="black")
-            draw.text((800, 450 + offset), overlay_text, font=font, fill="black")
-            
-        draw.text((800, 450), overlay_text, font=font, fill="yellow")
+        img_b64 = await self._generate_base_image(prompt)
         
+        # Compositing is CPU-bound and holds the GIL; run it in a worker
+        # process so the three variants use separate cores
         output_path = self.OUTPUT_DIR / f"{name}_final.png"
-        base_img.save(output_path)
+        await asyncio.get_running_loop().run_in_executor(
+            _PPOOL, _composite_thumbnail,
+            img_b64, user_image_path, overlay_text, self.bold_font_path, str(output_path)
+        )
         
         return f"/data/visuals/{output_path.name}"
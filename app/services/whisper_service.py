@@ -4,13 +4,237 @@ Uses Groq's ultra-fast Whisper API for transcription.
 """
 
 import os
+import asyncio
+import hashlib
 import logging
+import re
+import secrets
 import tempfile
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+import httpx
 import yt_dlp
-from groq import Groq
+from diskcache import Cache
+from groq import AsyncGroq
+try:
+    from youtube_transcript_api import YouTubeTranscriptApi
+except ImportError:  # Captions are an optional fast path; Whisper still works
+    YouTubeTranscriptApi = None
 from app.models.schemas import TranscriptResponse, TranscriptSegment
+from app.utils.loop_resources import close_replaced
 logger = logging.getLogger(__name__)
+
+# On-disk transcript cache, shared by the API process and Celery workers
+TRANSCRIPT_CACHE_DIR = os.getenv("TRANSCRIPT_CACHE_DIR", ".cache/transcripts")
+TRANSCRIPT_CACHE_TTL = 7 * 24 * 3600  # 7 days
+
+_TRANSCRIPT_CACHE: Optional[Cache] = None
+
+
+def _get_transcript_cache() -> Cache:
+    """Open the transcript cache on first use in this process."""
+    global _TRANSCRIPT_CACHE
+    if _TRANSCRIPT_CACHE is None:
+        _TRANSCRIPT_CACHE = Cache(TRANSCRIPT_CACHE_DIR)
+    return _TRANSCRIPT_CACHE
+
+
+# YouTube video ID in watch, short-link, embed and Shorts URLs
+_YT_ID_RE = re.compile(r'(?:v=|youtu\.be/|/embed/|/shorts/)([A-Za-z0-9_-]{11})')
+
+
+@lru_cache(maxsize=1024)
+def _fetch_yt_captions(video_id: str) -> Tuple[Tuple[str, float, float], ...]:
+    """
+    Fetch YouTube captions, memoized per process.
+    
+    Returns:
+        (text, start, duration) per caption; tuples so the result is hashable
+        and safe to share between callers
+    """
+    return tuple(
+        (item["text"], item["start"], item["duration"])
+        for item in YouTubeTranscriptApi.get_transcript(video_id)
+    )
+
+
+# One keep-alive pool for every Groq client in this process
+_SHARED_GROQ_HTTP: Optional[httpx.AsyncClient] = None
+_SHARED_GROQ_HTTP_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_groq_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide async HTTP client used by Groq.
+    Rebuilt if called from a different event loop (e.g. a Celery task
+    running its own asyncio.run), since httpx pools are loop-bound.
+    """
+    global _SHARED_GROQ_HTTP, _SHARED_GROQ_HTTP_LOOP
+    
+    loop = asyncio.get_running_loop()
+    if _SHARED_GROQ_HTTP is None or loop is not _SHARED_GROQ_HTTP_LOOP:
+        if _SHARED_GROQ_HTTP is not None:
+            close_replaced(_SHARED_GROQ_HTTP.aclose, _SHARED_GROQ_HTTP_LOOP, "Groq HTTP client")
+        _SHARED_GROQ_HTTP = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+        )
+        _SHARED_GROQ_HTTP_LOOP = loop
+        logger.info("Created shared Groq HTTP client")
+    return _SHARED_GROQ_HTTP
+
+
+async def close_groq_http_client() -> None:
+    """Close the shared Groq connection pool."""
+    global _SHARED_GROQ_HTTP, _SHARED_GROQ_HTTP_LOOP
+    
+    if _SHARED_GROQ_HTTP is not None:
+        await _SHARED_GROQ_HTTP.aclose()
+        _SHARED_GROQ_HTTP = None
+        _SHARED_GROQ_HTTP_LOOP = None
+
+
+# Long audio is encoded in windows of this length and the windows are
+# transcribed concurrently
+AUDIO_CHUNK_SECONDS = 600
+
+# Whisper calls arriving within WHISPER_BATCH_WINDOW seconds are dispatched together,
+# with at most WHISPER_MAX_CONCURRENCY requests in flight per event loop
+WHISPER_BATCH_SIZE = 8
+WHISPER_BATCH_WINDOW = 0.05
+WHISPER_MAX_CONCURRENCY = 16
+
+
+class WhisperBatcher:
+    """
+    Micro-batcher for Groq Whisper requests.
+    
+    Callers submit a zero-argument coroutine function that performs one
+    transcription request; a background coroutine collects up to batch_size
+    jobs (or whatever arrives within the window) and runs them concurrently
+    over the shared connection pool. Each caller awaits its own future.
+    
+    Groq has no batch transcription endpoint, so batching here only bounds
+    concurrency: every job is still its own API call, at most
+    max_concurrency run at once, and each waits up to one window to start.
+    """
+    
+    def __init__(
+        self,
+        batch_size: int = WHISPER_BATCH_SIZE,
+        window: float = WHISPER_BATCH_WINDOW,
+        max_concurrency: int = WHISPER_MAX_CONCURRENCY
+    ):
+        self.batch_size = batch_size
+        self.window = window
+        self._limit = asyncio.Semaphore(max_concurrency)
+        self._queue: asyncio.Queue[Tuple[Callable[[], Awaitable[Any]], asyncio.Future]] = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        # In-flight batches; held so they aren't garbage-collected mid-run
+        self._inflight: Set[asyncio.Task] = set()
+    
+    async def submit(self, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Queue a transcription request and wait for its result."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+        return await future
+    
+    async def _run(self) -> None:
+        """
+        Collect jobs into batches and dispatch each batch concurrently.
+        Batches run as their own tasks, so a slow call never holds back the
+        jobs queued behind it.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            if len(batch) > 1:
+                logger.info(f"Dispatching {len(batch)} Whisper requests as one batch")
+            task = asyncio.create_task(self._dispatch_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+    
+    async def _dispatch_batch(self, batch: List[Tuple[Callable[[], Awaitable[Any]], asyncio.Future]]) -> None:
+        """Run one batch of jobs concurrently."""
+        await asyncio.gather(*[self._dispatch(request, future) for request, future in batch])
+    
+    async def _dispatch(self, request: Callable[[], Awaitable[Any]], future: asyncio.Future) -> None:
+        """Run one job and resolve its future."""
+        try:
+            async with self._limit:
+                result = await request()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+    
+    async def close(self) -> None:
+        """
+        Cancel the collector, in-flight batches and queued jobs (the batcher
+        is being replaced). On a loop that has already closed, tasks that
+        asyncio.run didn't cancel can only be dropped.
+        """
+        pending = [task for task in (self._worker, *self._inflight) if task is not None and not task.done()]
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait()[1])
+        self._worker = None
+        
+        for task_or_future in pending:
+            try:
+                task_or_future.cancel()
+            except RuntimeError:
+                pass  # Its loop is closed, so its callbacks can't be scheduled
+
+
+_WHISPER_BATCHER: Optional[WhisperBatcher] = None
+_WHISPER_BATCHER_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _submit_to_batcher(request: Callable[[], Awaitable[Any]]) -> Any:
+    """Submit a job to this event loop's batcher, creating it on first use."""
+    global _WHISPER_BATCHER, _WHISPER_BATCHER_LOOP
+    
+    loop = asyncio.get_running_loop()
+    if _WHISPER_BATCHER is None or _WHISPER_BATCHER_LOOP is not loop:
+        if _WHISPER_BATCHER is not None:
+            close_replaced(_WHISPER_BATCHER.close, _WHISPER_BATCHER_LOOP, "Whisper batcher")
+        _WHISPER_BATCHER = WhisperBatcher()
+        _WHISPER_BATCHER_LOOP = loop
+    return await _WHISPER_BATCHER.submit(request)
+
+
+def _cache_mode(need_segments: bool) -> str:
+    """Cache-key tag: text-only and segmented transcripts are stored apart."""
+    return "segments" if need_segments else "text"
+
+
+def _file_sha256(path: str) -> str:
+    """Hash a file in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
 class WhisperService:
     """Service for transcribing video/audio using Groq's Whisper API."""
     
@@ -27,42 +251,103 @@ class WhisperService:
         if not self.api_key:
             raise ValueError("GROQ_API_KEY is required for transcription")
         
-        self.client = Groq(api_key=self.api_key)
+        self._async_client: Optional[AsyncGroq] = None
+        self._async_client_http: Optional[httpx.AsyncClient] = None
         logger.info(f"Groq Whisper service initialized with model: {model_name}")
     
-    async def transcribe_from_url_async(self, video_url: str, progress_callback=None) -> TranscriptResponse:
+    @property
+    def async_client(self) -> AsyncGroq:
+        """AsyncGroq client on the current loop's shared connection pool."""
+        http_client = _get_groq_http_client()
+        if self._async_client is None or self._async_client_http is not http_client:
+            self._async_client = AsyncGroq(api_key=self.api_key, http_client=http_client)
+            self._async_client_http = http_client
+        return self._async_client
+    
+    async def transcribe_from_url_async(
+        self,
+        video_url: str,
+        progress_callback=None,
+        use_cache: bool = True,
+        need_segments: bool = False
+    ) -> TranscriptResponse:
         """
-        Async transcription for non-blocking performance.
+        Transcribe video from a URL using Groq's Whisper API.
+        Repeat URLs are served from the on-disk transcript cache; otherwise
+        tries to fetch existing YouTube captions first (Zero-Download).
+        
+        Runs natively on the event loop; only the blocking cache I/O, caption
+        fetch and yt-dlp download are handed to threads.
         
         Args:
             video_url: URL to the video file
-            progress_callback: Optional async function to call with progress (0-100)
+            progress_callback: Optional function to call with progress (0-100)
+            use_cache: Read and write the on-disk transcript cache
+            need_segments: Return timestamped segments; when False only the
+                full text is requested, which is a much smaller response
             
         Returns:
-            TranscriptResponse with segments and full text
+            TranscriptResponse with full text (and segments if requested)
         """
-        import asyncio
-        return await asyncio.to_thread(self.transcribe_from_url, video_url, progress_callback)
+        # Ensure video_url is a string (Pydantic HttpUrl can cause issues)
+        video_url = str(video_url)
+        
+        if not use_cache:
+            return await self._transcribe_uncached(video_url, progress_callback, None, need_segments)
+        
+        # diskcache is blocking SQLite + file I/O; keep it off the event loop
+        cache = await asyncio.to_thread(_get_transcript_cache)
+        url_key = f"url:{_cache_mode(need_segments)}:{hashlib.sha256(video_url.encode()).hexdigest()}"
+        
+        cached = await asyncio.to_thread(cache.get, url_key)
+        if cached is not None:
+            logger.info(f"Transcript cache hit for URL: {video_url}")
+            if progress_callback:
+                progress_callback(100)
+            return TranscriptResponse.model_validate_json(cached)
+        
+        logger.info(f"Transcript cache miss for URL: {video_url}")
+        result = await self._transcribe_uncached(video_url, progress_callback, cache, need_segments)
+        await asyncio.to_thread(cache.set, url_key, result.model_dump_json(), expire=TRANSCRIPT_CACHE_TTL)
+        return result
     
-    def transcribe_from_url(self, video_url: str, progress_callback=None) -> TranscriptResponse:
+    def transcribe_from_url(
+        self,
+        video_url: str,
+        progress_callback=None,
+        use_cache: bool = True,
+        need_segments: bool = False
+    ) -> TranscriptResponse:
         """
-        Transcribe video from a URL using Groq's Whisper API.
-        Tries to fetch existing YouTube captions first (Zero-Download).
+        Blocking wrapper around transcribe_from_url_async for callers on a
+        plain thread. Runs its own event loop, so it must not be called from
+        inside a running one.
         
         Args:
             video_url: URL to the video file
             progress_callback: Optional function to call with progress (0-100)
+            use_cache: Read and write the on-disk transcript cache
+            need_segments: Return timestamped segments as well as the text
             
         Returns:
-            TranscriptResponse with segments and full text
+            TranscriptResponse with full text (and segments if requested)
+        """
+        return asyncio.run(
+            self.transcribe_from_url_async(video_url, progress_callback, use_cache, need_segments)
+        )
+    
+    async def _transcribe_uncached(
+        self,
+        video_url: str,
+        progress_callback,
+        cache: Optional[Cache],
+        need_segments: bool
+    ) -> TranscriptResponse:
+        """
+        Captions-first transcription behind transcribe_from_url_async.
+        When a cache is given, Whisper results are also keyed on the audio
+        bytes so the same media under a different URL skips the API call.
         """
-        import time
-        from youtube_transcript_api import YouTubeTranscriptApi
-        from urllib.parse import urlparse, parse_qs
-        
-        # Ensure video_url is a string (Pydantic HttpUrl can cause issues)
-        video_url = str(video_url)
-        
         start_time = time.time()
         logger.info(f"Starting transcription for: {video_url}")
         
@@ -72,42 +357,41 @@ class WhisperService:
         # STRATEGY 1: Try fetching YouTube Captions (Instant)
         try:
             # Extract Video ID
-            parsed_url = urlparse(video_url)
-            video_id = None
-            if "youtube.com" in parsed_url.netloc:
-                video_id = parse_qs(parsed_url.query).get("v", [None])[0]
-            elif "youtu.be" in parsed_url.netloc:
-                video_id = parsed_url.path.lstrip("/")
+            m = _YT_ID_RE.search(video_url)
+            video_id = m.group(1) if m else None
             
-            if video_id:
+            if video_id and YouTubeTranscriptApi is not None:
                 logger.info(f"Detected YouTube Video ID: {video_id}. Attempting to fetch captions...")
-                transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
+                captions = await asyncio.to_thread(_fetch_yt_captions, video_id)
                 
                 if progress_callback:
                     progress_callback(50) # Halfway there after instant fetch
 
-                # Convert to TranscriptResponse format
-                segments = []
-                full_text = []
-                for item in transcript_list:
-                    text = item["text"]
-                    start = item["start"]
-                    end = start + item["duration"]
-                    segments.append(TranscriptSegment(
-                        start=start,
-                        end=end,
-                        text=text
-                    ))
-                    full_text.append(text)
+                # Convert to TranscriptResponse format (trusted API data, so
+                # segments skip per-item validation). One pass builds segments
+                # and text together, with method lookups bound outside the loop
+                segments: List[TranscriptSegment] = []
+                if need_segments:
+                    texts: List[str] = []
+                    segment_append = segments.append
+                    text_append = texts.append
+                    construct = TranscriptSegment.model_construct
+                    for text, start, duration in captions:
+                        segment_append(construct(start=start, end=start + duration, text=text, speaker=None))
+                        text_append(text)
+                else:
+                    # str.join materializes its input anyway; a list skips the generator frames
+                    texts = [caption[0] for caption in captions]
                 
                 if progress_callback:
                     progress_callback(100) # Done
 
-                logger.info(f"✅ Fetched YouTube captions instantly! ({len(segments)} segments)")
+                logger.info(f"✅ Fetched YouTube captions instantly! ({len(captions)} segments)")
+                _, last_start, last_duration = captions[-1] if captions else ("", 0.0, 0.0)
                 return TranscriptResponse(
                     segments=segments,
-                    full_text=" ".join(full_text),
-                    language="en"
+                    full_text=" ".join(texts),
+                    duration_seconds=last_start + last_duration
                 )
         except Exception as e:
             logger.warning(f"Could not fetch YouTube captions: {e}. Falling back to audio download.")
@@ -115,30 +399,55 @@ class WhisperService:
         # STRATEGY 2: Download Audio + Groq Whisper (Fallback)
         logger.info("Fallback: Downloading audio for Groq Whisper...")
         
-        # Download audio to temp file
+        # Download the source audio (no transcode to disk)
         download_start = time.time()
-        audio_path = self._download_audio(video_url, progress_callback)
+        downloaded = await asyncio.to_thread(self._download_audio, video_url, progress_callback)
         download_time = time.time() - download_start
-        logger.info(f"Audio download + conversion took: {download_time:.2f}s")
+        logger.info(f"Audio download took: {download_time:.2f}s")
         
-        if not audio_path:
+        if not downloaded:
             raise ValueError("Failed to download audio for transcription")
+        source_path, duration = downloaded
         
         try:
+            audio_key = None
+            if cache is not None:
+                audio_key = f"audio:{_cache_mode(need_segments)}:{await asyncio.to_thread(_file_sha256, source_path)}"
+                cached = await asyncio.to_thread(cache.get, audio_key)
+                if cached is not None:
+                    logger.info("Transcript cache hit for downloaded audio")
+                    if progress_callback:
+                        progress_callback(100)
+                    return TranscriptResponse.model_validate_json(cached)
+                logger.info("Transcript cache miss for downloaded audio")
+            
+            # Encode straight into memory, split so long audio transcribes in parallel
+            chunks = await self._encode_chunks(source_path, duration)
+            
             # Transcribe with Groq Whisper
-            logger.info("Sending to Groq Whisper API (ultra-fast)...")
+            logger.info(f"Sending {len(chunks)} chunk(s) to Groq Whisper API (ultra-fast)...")
             if progress_callback:
                 progress_callback(90) # Almost done, waiting for API
 
             api_start = time.time()
             
-            with open(audio_path, "rb") as audio_file:
-                transcription = self.client.audio.transcriptions.create(
-                    file=audio_file,
-                    model=self.model_name,
-                    response_format="verbose_json",
-                    language="en"
-                )
+            client = self.async_client
+            
+            def transcription_request(index: int, audio_bytes: bytes) -> Callable[[], Awaitable[Any]]:
+                def create_transcription():
+                    return client.audio.transcriptions.create(
+                        file=(f"audio_{index:03d}.mp3", audio_bytes),
+                        model=self.model_name,
+                        # Plain json is text only, far smaller than verbose_json
+                        response_format="verbose_json" if need_segments else "json",
+                        language="en"
+                    )
+                return create_transcription
+            
+            transcriptions = await asyncio.gather(*[
+                _submit_to_batcher(transcription_request(i, audio_bytes))
+                for i, (audio_bytes, _) in enumerate(chunks)
+            ])
             
             api_time = time.time() - api_start
             total_time = time.time() - start_time
@@ -148,73 +457,148 @@ class WhisperService:
             if progress_callback:
                 progress_callback(100) # Done
 
-            # Parse results
-            return self._parse_result(transcription)
+            # Parse results (chunk timestamps shifted to the full audio)
+            result = self._parse_result(
+                [(transcription, offset) for transcription, (_, offset) in zip(transcriptions, chunks)],
+                duration
+            )
+            if audio_key:
+                await asyncio.to_thread(cache.set, audio_key, result.model_dump_json(), expire=TRANSCRIPT_CACHE_TTL)
+            return result
             
         finally:
-            # Cleanup temp audio
-            if audio_path and os.path.exists(audio_path):
-                os.remove(audio_path)
+            # Cleanup the downloaded source
+            if os.path.exists(source_path):
+                os.remove(source_path)
                 logger.info("Cleaned up temp audio file")
     
-    def _download_audio(self, video_url: str, progress_callback=None) -> Optional[str]:
+    async def _encode_chunks(self, source_path: str, duration: Optional[float]) -> List[Tuple[bytes, float]]:
+        """
+        Transcode the source audio to mono 16 kHz mp3 in memory, one ffmpeg
+        process per AUDIO_CHUNK_SECONDS window, all running concurrently.
+        
+        Args:
+            source_path: Downloaded source audio
+            duration: Length in seconds if known (unknown means one chunk)
+            
+        Returns:
+            List of (mp3 bytes, start offset in seconds), in order
+        """
+        if duration and duration > AUDIO_CHUNK_SECONDS:
+            offsets = list(range(0, int(duration), AUDIO_CHUNK_SECONDS))
+        else:
+            offsets = [0]
+        
+        async def encode(offset: int) -> bytes:
+            cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error"]
+            if len(offsets) > 1:
+                cmd += ["-ss", str(offset), "-t", str(AUDIO_CHUNK_SECONDS)]
+            cmd += [
+                "-i", source_path,
+                # Mono 16 kHz is what Whisper resamples to anyway; 32 kbps mp3
+                # at that rate keeps speech intact at half the old payload
+                "-vn", "-ac", "1", "-ar", "16000",
+                "-f", "mp3", "-b:a", "32k",
+                "pipe:1"
+            ]
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await proc.communicate()
+            if proc.returncode != 0:
+                raise RuntimeError(f"ffmpeg failed: {stderr.decode(errors='replace').strip()}")
+            return stdout
+        
+        encoded = await asyncio.gather(*[encode(offset) for offset in offsets])
+        
+        logger.info(
+            f"Encoded audio in memory: {sum(map(len, encoded)) / (1024 * 1024):.1f} MB "
+            f"in {len(encoded)} chunk(s)"
+        )
+        return [(audio_bytes, float(offset)) for audio_bytes, offset in zip(encoded, offsets) if audio_bytes]
+    
+    def _download_audio(self, video_url: str, progress_callback=None) -> Optional[Tuple[str, Optional[float]]]:
         """
-        Download audio from video URL using yt-dlp.
-        Uses fast settings for speed.
+        Download the source audio stream from a video URL using yt-dlp.
+        Uses fast settings for speed; transcoding happens later, in memory.
         
         Args:
             video_url: URL to download from
             progress_callback: Optional function to call with progress (0-100)
             
         Returns:
-            Path to downloaded audio file
+            (path to downloaded audio file, duration in seconds if known)
         """
-        # Create a unique temp file path
-        output_path = os.path.join(tempfile.gettempdir(), f"groq_audio_{hash(video_url) & 0xFFFFFFFF}.mp3")
+        # Create a unique temp file path: a stable 128-bit URL digest plus a
+        # per-call suffix so concurrent jobs for the same URL never share a file
+        url_digest = hashlib.blake2b(video_url.encode(), digest_size=16).hexdigest()
+        output_path = os.path.join(tempfile.gettempdir(), f"groq_audio_{url_digest}_{secrets.token_hex(4)}")
+        
+        # yt-dlp reports progress per fragment (hundreds of ticks/sec); only
+        # emit when the percent changes and the last emit is 500 ms old
+        last_percent = -1
+        last_emit = 0.0
         
         def ydl_progress_hook(d):
+            nonlocal last_percent, last_emit
             if d['status'] == 'downloading' and progress_callback:
                 try:
                     p = d.get('_percent_str', '0%').replace('%','')
                     # Map download 0-100% to step 10-80%
-                    percent = 10 + (float(p) * 0.7)
-                    progress_callback(int(percent))
+                    percent = int(10 + (float(p) * 0.7))
+                    now = time.monotonic()
+                    if percent != last_percent and now - last_emit >= 0.5:
+                        last_percent = percent
+                        last_emit = now
+                        progress_callback(percent)
                 except:
                     pass
 
         ydl_opts = {
-            'format': 'worstaudio/worst',  # Fastest download (smallest file)
-            'outtmpl': output_path.replace('.mp3', '.%(ext)s'),
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '64',  # Low quality for speed (still fine for speech)
-            }],
+            # Fastest download: smallest audio-only format, picked by size then bitrate
+            'format': 'bestaudio/best',
+            'format_sort': ['+size', '+br'],
+            'outtmpl': f"{output_path}.%(ext)s",
+            'noplaylist': True,
+            'writeinfojson': False,
+            'writesubtitles': False,
+            'writeautomaticsub': False,
             'quiet': True,
             'no_warnings': True,
             'progress_hooks': [ydl_progress_hook],
-            'concurrent_fragment_downloads': 16,
-            # Turbo Download Settings (Aria2c)
+            # Turbo Download Settings (Aria2c): a few connections per file;
+            # CDNs throttle hard at higher fan-out
             'external_downloader': 'aria2c',
-            'external_downloader_args': ['-x16', '-s16', '-k1M'],
+            'external_downloader_args': [
+                '-x4', '-s4', '-k1M',
+                '--file-allocation=none',
+                '--summary-interval=0',
+                '--optimize-concurrent-downloads=true',
+            ],
+            # aria2c already splits the transfer; yt-dlp fragment parallelism
+            # on top of it would multiply the connection count
+            'concurrent_fragment_downloads': 1,
         }
         
         try:
             logger.info("Downloading audio stream (fast mode)...")
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([video_url])
+                # One metadata round-trip, then download the format it already
+                # resolved (format selection on the cached dict is local)
+                info = ydl.extract_info(video_url, download=False)
+                logger.info(f"Selected audio format {info.get('format_id')} ({info.get('ext')})")
+                info = ydl.process_ie_result(info, download=True)
             
-            # Check for mp3 file
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
-                logger.info(f"Downloaded audio: {file_size:.1f} MB")
-                return output_path
+            duration = info.get("duration")
+            downloads = info.get("requested_downloads") or []
+            candidates = [d.get("filepath") for d in downloads]
+            candidates += [f"{output_path}{ext}" for ext in ['.webm', '.m4a', '.opus', '.mp3']]
             
-            # Try common extensions
-            for ext in ['.webm', '.m4a', '.opus', '.mp3']:
-                alt_path = output_path.replace('.mp3', ext)
-                if os.path.exists(alt_path):
-                    return alt_path
+            for path in candidates:
+                if path and os.path.exists(path):
+                    file_size = os.path.getsize(path) / (1024 * 1024)  # MB
+                    logger.info(f"Downloaded audio: {file_size:.1f} MB")
+                    return path, duration
             
             logger.error(f"Audio file not found at: {output_path}")
             return None
@@ -223,30 +607,40 @@ class WhisperService:
             logger.error(f"Audio download failed: {str(e)}")
             return None
     
-    def _parse_result(self, transcription) -> TranscriptResponse:
+    def _parse_result(self, chunk_results: List[Tuple[Any, float]], audio_duration: Optional[float] = None) -> TranscriptResponse:
         """
-        Parse Groq transcription result into TranscriptResponse.
+        Parse Groq transcription results into one TranscriptResponse.
         
         Args:
-            transcription: Groq transcription response
+            chunk_results: (Groq transcription response, chunk start offset in
+                seconds) per audio chunk, in order
+            audio_duration: Source length, used when no segments were requested
             
         Returns:
             Structured TranscriptResponse
         """
         segments = []
+        texts = []
         
-        # Groq returns segments in verbose_json format
-        if hasattr(transcription, 'segments') and transcription.segments:
-            for seg in transcription.segments:
-                segments.append(TranscriptSegment(
-                    start=seg.get("start", 0),
-                    end=seg.get("end", 0),
-                    text=seg.get("text", "").strip(),
-                    speaker=None
-                ))
+        for transcription, offset in chunk_results:
+            # Groq returns segments in verbose_json format; trusted API data,
+            # so segments skip per-item validation
+            if hasattr(transcription, 'segments') and transcription.segments:
+                segments.extend([
+                    TranscriptSegment.model_construct(
+                        start=seg.get("start", 0) + offset,
+                        end=seg.get("end", 0) + offset,
+                        text=seg.get("text", "").strip(),
+                        speaker=None
+                    )
+                    for seg in transcription.segments
+                ])
+            
+            if hasattr(transcription, 'text') and transcription.text:
+                texts.append(transcription.text.strip())
         
-        full_text = transcription.text if hasattr(transcription, 'text') else ""
-        duration = segments[-1].end if segments else 0.0
+        full_text = " ".join(texts)
+        duration = segments[-1].end if segments else float(audio_duration or 0.0)
         
         logger.info(f"Transcription complete: {len(segments)} segments, {duration:.1f}s duration")
         
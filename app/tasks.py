@@ -2,7 +2,13 @@
 Celery tasks for background video processing.
 """
 
+import asyncio
 import logging
+from types import SimpleNamespace
+from typing import Optional
+
+from celery.signals import worker_process_init
+
 from app.celery_app import celery_app
 from app.services.whisper_service import WhisperService
 from app.services.airtable_service import AirtableService
@@ -12,6 +18,42 @@ from app.models.schemas import ContentOutput, AnalysisOutput
 
 logger = logging.getLogger(__name__)
 
+# Worker-lifetime service singletons, built once per worker process
+_SERVICES = SimpleNamespace(whisper=None, content_engine=None, avatar=None, airtable=None)
+
+# One event loop per worker process, so the loop-bound shared clients
+# (OpenAI, httpx, Groq) held by the services stay valid across tasks
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _init_services() -> None:
+    """Construct the pipeline services and store them on _SERVICES."""
+    _SERVICES.whisper = WhisperService(model_name="tiny")
+    _SERVICES.content_engine = ContentGenerationEngine()
+    _SERVICES.avatar = AvatarService()
+    _SERVICES.airtable = AirtableService()
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get the worker's event loop, creating it on first use."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+@worker_process_init.connect
+def preload_services(**kwargs):
+    """Pay service cold-start cost once per worker process, not per task."""
+    try:
+        _init_services()
+        logger.info("[CELERY] Services preloaded")
+    except Exception as e:
+        # Leave construction to the first task so the error surfaces in its result
+        logger.error(f"[CELERY] Service preload failed: {str(e)}")
+    _get_worker_loop()
+
 
 @celery_app.task(bind=True, name="process_video")
 def process_video_task(self, video_url: str, client_id: str, tone_profile: str):
@@ -26,17 +68,17 @@ def process_video_task(self, video_url: str, client_id: str, tone_profile: str):
     Returns:
         dict with processing results
     """
-    import asyncio
-    
     async def run_pipeline():
         try:
+            if _SERVICES.airtable is None:
+                _init_services()
+            
             # Update task state
             self.update_state(state="TRANSCRIBING", meta={"phase": 1})
             
             # Phase 1: Transcription
             logger.info(f"[CELERY] Phase 1: Transcribing video for {client_id}")
-            whisper_service = WhisperService(model_name="tiny")
-            transcript_response = await whisper_service.transcribe_from_url_async(video_url)
+            transcript_response = await _SERVICES.whisper.transcribe_from_url_async(video_url)
             
             if not transcript_response.full_text:
                 raise ValueError("Transcription returned empty result")
@@ -44,19 +86,18 @@ def process_video_task(self, video_url: str, client_id: str, tone_profile: str):
             # Phase 2: Content Generation
             self.update_state(state="GENERATING", meta={"phase": 2})
             logger.info("[CELERY] Phase 2: Generating content...")
-            content_engine = ContentGenerationEngine()
-            generated_content = await content_engine.generate_all_content(
+            generated_content = await _SERVICES.content_engine.generate_all_content(
                 transcript=transcript_response.full_text,
                 tone_profile=tone_profile
             )
             
-            # Phase 3: AI Avatar
+            # Phase 3: AI Avatar (runs while the Airtable record is written;
+            # the record does not depend on the avatar)
             self.update_state(state="AVATAR", meta={"phase": 3})
             logger.info("[CELERY] Phase 3: Generating AI Avatar...")
-            avatar_service = AvatarService()
-            avatar_video_url = await avatar_service.generate_avatar_video(
+            avatar_task = asyncio.create_task(_SERVICES.avatar.generate_avatar_video(
                 text=generated_content.get("linkedin_post", "")[:500]
-            )
+            ))
             
             # Phase 4: Store in Airtable
             self.update_state(state="STORING", meta={"phase": 4})
@@ -73,15 +114,17 @@ def process_video_task(self, video_url: str, client_id: str, tone_profile: str):
                 analysis=analysis_output,
                 linkedin_post=generated_content.get("linkedin_post", ""),
                 twitter_thread=generated_content.get("twitter_thread", []),
-                blog_post=generated_content.get("blog_post", ""),
-                avatar_video_url=avatar_video_url
+                blog_post=generated_content.get("blog_post", "")
             )
             
-            airtable_service = AirtableService()
-            record_data = airtable_service.create_record(
-                client_id=client_id,
-                content=content_output,
-                video_url=video_url
+            avatar_video_url, record_data = await asyncio.gather(
+                avatar_task,
+                asyncio.to_thread(
+                    _SERVICES.airtable.create_record,
+                    client_id=client_id,
+                    content=content_output,
+                    video_url=video_url
+                )
             )
             
             logger.info(f"[CELERY] Processing complete for {client_id}")
@@ -90,6 +133,7 @@ def process_video_task(self, video_url: str, client_id: str, tone_profile: str):
                 "success": True,
                 "client_id": client_id,
                 "airtable_url": record_data.get("url", ""),
+                "avatar_video_url": avatar_video_url,
                 "content": content_output.model_dump()
             }
             
@@ -101,5 +145,5 @@ def process_video_task(self, video_url: str, client_id: str, tone_profile: str):
                 "error": str(e)
             }
     
-    # Run the async pipeline
-    return asyncio.run(run_pipeline())
+    # Run the async pipeline on the worker's persistent loop
+    return _get_worker_loop().run_until_complete(run_pipeline())
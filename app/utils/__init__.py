@@ -1,5 +1,19 @@
 """Utility functions and helpers."""
 
-from .retry import retry_with_backoff
+from .retry import retry_with_backoff, retry_async, is_transient_error
+from .openai_client import TIMEOUTS, TimeoutConfig, get_openai_client, close_openai_client
+from .http_client import get_http_client, close_http_client
+from .loop_resources import close_replaced
 
-__all__ = ["retry_with_backoff"]
+__all__ = [
+    "retry_with_backoff",
+    "retry_async",
+    "is_transient_error",
+    "TIMEOUTS",
+    "TimeoutConfig",
+    "get_openai_client",
+    "close_openai_client",
+    "get_http_client",
+    "close_http_client",
+    "close_replaced",
+]
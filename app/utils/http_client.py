@@ -0,0 +1,54 @@
+"""
+Shared httpx.AsyncClient for plain third-party HTTP calls (Pexels search,
+carousel font downloads). OpenAI and Groq keep their own tuned pools.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+
+from app.utils.loop_resources import close_replaced
+
+logger = logging.getLogger(__name__)
+
+_HTTPX: Optional[httpx.AsyncClient] = None
+_HTTPX_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide httpx.AsyncClient.
+
+    Rebuilt when called from a different event loop, since httpx connection
+    pools are loop-bound.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _HTTPX, _HTTPX_LOOP
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _HTTPX is None or (loop is not None and loop is not _HTTPX_LOOP):
+        if _HTTPX is not None:
+            close_replaced(_HTTPX.aclose, _HTTPX_LOOP, "httpx client")
+        _HTTPX = httpx.AsyncClient(timeout=30.0, limits=httpx.Limits(max_connections=20))
+        _HTTPX_LOOP = loop
+        logger.info("Created shared httpx client")
+
+    return _HTTPX
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its connection pool."""
+    global _HTTPX, _HTTPX_LOOP
+
+    if _HTTPX is not None:
+        await _HTTPX.aclose()
+        _HTTPX = None
+        _HTTPX_LOOP = None
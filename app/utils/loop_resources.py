@@ -0,0 +1,46 @@
+"""
+Cleanup for process-wide clients that are bound to one event loop.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Close tasks in flight; held so they aren't garbage-collected mid-run
+_PENDING_CLOSES: Set[asyncio.Task] = set()
+
+
+def close_replaced(
+    close: Callable[[], Awaitable[Any]],
+    owner_loop: Optional[asyncio.AbstractEventLoop],
+    name: str
+) -> None:
+    """
+    Close a shared client that is being replaced because the event loop changed.
+
+    The close runs as a task on the current loop. Once the owning loop has
+    closed, its connections can only be released best effort (the close
+    still drops their sockets, but may report an error, which is logged).
+    A client whose loop is still running in another thread is left alone,
+    since requests on that loop may still be using it.
+
+    Args:
+        close: Async close method of the replaced client
+        owner_loop: Loop the client was created on (None if created outside one)
+        name: Client name for logging
+    """
+    if owner_loop is not None and owner_loop.is_running():
+        logger.info(f"Replaced {name} is still in use on another event loop; not closing it")
+        return
+
+    async def _close() -> None:
+        try:
+            await close()
+        except Exception as e:
+            logger.debug(f"Replaced {name} closed with error: {e}")
+
+    task = asyncio.get_running_loop().create_task(_close())
+    _PENDING_CLOSES.add(task)
+    task.add_done_callback(_PENDING_CLOSES.discard)
@@ -0,0 +1,76 @@
+"""
+Shared AsyncOpenAI client with a pooled HTTP connection.
+"""
+
+import os
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.utils.loop_resources import close_replaced
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TimeoutConfig:
+    """Timeout budgets (seconds) for OpenAI calls."""
+    llm_request: float = 20.0        # Per HTTP request (client-level)
+    llm_standard: float = 60.0       # One chat call attempt
+    image_generation: float = 120.0  # One image call attempt
+
+
+TIMEOUTS = TimeoutConfig()
+
+_SHARED_OPENAI: Optional[AsyncOpenAI] = None
+_SHARED_OPENAI_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Return the process-wide AsyncOpenAI client.
+
+    Services share one client so keep-alive connections are reused across
+    requests instead of paying a TCP/TLS handshake per service instance.
+    The client is rebuilt if called from a different event loop (e.g. a
+    Celery task running its own asyncio.run), since httpx pools are loop-bound.
+
+    Returns:
+        Shared AsyncOpenAI client
+    """
+    global _SHARED_OPENAI, _SHARED_OPENAI_LOOP
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _SHARED_OPENAI is None or (loop is not None and loop is not _SHARED_OPENAI_LOOP):
+        if _SHARED_OPENAI is not None:
+            close_replaced(_SHARED_OPENAI.close, _SHARED_OPENAI_LOOP, "AsyncOpenAI client")
+        _SHARED_OPENAI = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            timeout=httpx.Timeout(TIMEOUTS.llm_request, connect=10.0),
+            max_retries=0,  # Callers retry with jittered backoff via retry_async
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            ),
+        )
+        _SHARED_OPENAI_LOOP = loop
+        logger.info("Created shared AsyncOpenAI client")
+
+    return _SHARED_OPENAI
+
+
+async def close_openai_client() -> None:
+    """Close the shared client and its connection pool."""
+    global _SHARED_OPENAI, _SHARED_OPENAI_LOOP
+
+    if _SHARED_OPENAI is not None:
+        await _SHARED_OPENAI.close()
+        _SHARED_OPENAI = None
+        _SHARED_OPENAI_LOOP = None
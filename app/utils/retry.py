@@ -3,9 +3,22 @@ Retry utilities with exponential backoff.
 """
 
 import time
+import random
+import asyncio
 import functools
 import logging
-from typing import Callable, TypeVar, Any
+from typing import Callable, TypeVar, Any, Optional
+
+import httpx
+import openai
+from tenacity import (
+    AsyncRetrying,
+    before_sleep_log,
+    retry_if_exception,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +46,10 @@ def retry_with_backoff(
         Decorated function with retry logic
     """
     
+    # Delay schedule is fixed per decoration; each wait is jittered by
+    # x0.5-1.5 so callers failing together don't retry in lockstep
+    delays = [min(base_delay * (exponential_base ** i), max_delay) for i in range(max_retries)]
+    
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
@@ -51,8 +68,7 @@ def retry_with_backoff(
                         )
                         raise
                     
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (exponential_base ** attempt), max_delay)
+                    delay = delays[attempt] * random.uniform(0.5, 1.5)
                     
                     logger.warning(
                         f"Attempt {attempt + 1}/{max_retries + 1} for {func.__name__} failed: {str(e)}. "
@@ -68,7 +84,6 @@ def retry_with_backoff(
         
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> T:
-            import asyncio
             last_exception = None
             
             for attempt in range(max_retries + 1):
@@ -84,7 +99,7 @@ def retry_with_backoff(
                         )
                         raise
                     
-                    delay = min(base_delay * (exponential_base ** attempt), max_delay)
+                    delay = delays[attempt] * random.uniform(0.5, 1.5)
                     
                     logger.warning(
                         f"Attempt {attempt + 1}/{max_retries + 1} for {func.__name__} failed: {str(e)}. "
@@ -98,14 +113,65 @@ def retry_with_backoff(
             raise RuntimeError(f"Unexpected state in retry logic for {func.__name__}")
         
         # Return appropriate wrapper based on function type
-        if asyncio_iscoroutinefunction(func):
+        if asyncio.iscoroutinefunction(func):
             return async_wrapper
         return wrapper
     
     return decorator
 
 
-def asyncio_iscoroutinefunction(func: Callable) -> bool:
-    """Check if a function is a coroutine function."""
-    import asyncio
-    return asyncio.iscoroutinefunction(func)
+# HTTP statuses worth retrying: rate limits and transient upstream failures
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 529})
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Return True for rate limits, 5xx responses, timeouts and connection errors."""
+    if isinstance(exc, (asyncio.TimeoutError, httpx.TimeoutException, httpx.NetworkError)):
+        return True
+    if isinstance(exc, (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
+def retry_async(
+    max_attempts: int = 5,
+    min_wait: float = 2.0,
+    max_wait: float = 30.0,
+    retryable: Optional[tuple] = None,
+) -> Callable:
+    """
+    Decorator that retries a coroutine on transient API failures,
+    waiting a randomized exponential backoff between attempts.
+    
+    Args:
+        max_attempts: Total attempts including the first call
+        min_wait: Lower bound of the backoff in seconds
+        max_wait: Upper bound of the backoff in seconds
+        retryable: Exception types to retry; defaults to is_transient_error
+    
+    Returns:
+        Decorated coroutine function with retry logic
+    """
+    retry_condition = (
+        retry_if_exception_type(retryable) if retryable
+        else retry_if_exception(is_transient_error)
+    )
+    
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            async for attempt in AsyncRetrying(
+                wait=wait_random_exponential(min=min_wait, max=max_wait),
+                stop=stop_after_attempt(max_attempts),
+                retry=retry_condition,
+                before_sleep=before_sleep_log(logger, logging.WARNING),
+                reraise=True,
+            ):
+                with attempt:
+                    return await func(*args, **kwargs)
+        
+        return wrapper
+    
+    return decorator
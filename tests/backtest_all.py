@@ -244,5 +244,11 @@ if __name__ == "__main__":
     from dotenv import load_dotenv
     load_dotenv()
     
+    try:
+        import uvloop  # Optional, test-only: faster event loop when installed
+        uvloop.install()
+    except ImportError:
+        pass
+    
     success = asyncio.run(run_all_tests())
     sys.exit(0 if success else 1)
@@ -0,0 +1,50 @@
+"""
+Pytest setup for the service test scripts.
+Lets `pytest -n auto tests/` run the standalone `async def test_*` scripts in
+parallel workers without changing how they run via `python tests/<file>.py`.
+"""
+
+import asyncio
+import inspect
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+# Tests that only run against live services (no mocked path), by the env vars they need
+LIVE_ONLY = {
+    "test_visual_service": ("OPENAI_API_KEY",),
+    "test_streaming_full": ("STREAM_API_URL",),
+}
+
+
+def pytest_configure(config):
+    try:
+        import uvloop  # Optional, test-only: faster event loop when installed
+        uvloop.install()
+    except ImportError:
+        pass
+
+
+def pytest_pyfunc_call(pyfuncitem):
+    """Run coroutine tests on a fresh event loop, as their __main__ blocks do."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj) or pyfuncitem.get_closest_marker("asyncio"):
+        return None  # Sync test, or already handled by pytest-asyncio
+
+    # funcargs also holds autouse fixtures; pass only what the test declares
+    params = inspect.signature(pyfuncitem.obj).parameters
+    kwargs = {name: value for name, value in pyfuncitem.funcargs.items() if name in params}
+    asyncio.run(pyfuncitem.obj(**kwargs))
+    return True
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip live-only tests whose env vars aren't set, rather than passing them vacuously."""
+    for item in items:
+        missing = [key for key in LIVE_ONLY.get(item.name, ()) if not os.getenv(key)]
+        if missing:
+            item.add_marker(pytest.mark.skip(reason=f"needs {', '.join(missing)}"))
@@ -28,38 +28,45 @@ async def test_audio_service():
     if not has_eleven:
         print("⚠️ ELEVENLABS_API_KEY missing. Using MOCKS for audio generation.")
         service.el_client = MagicMock()
-        # Mock save function
-        import app.services.audio_service as audio_mod
-        audio_mod.save = MagicMock()
+        # Streamed MP3 chunks, as returned by text_to_speech.convert
+        service.el_client.text_to_speech.convert.return_value = [b"MOCK ", b"AUDIO DATA"]
 
     # 1. Test Translation
     print("\n--- Testing DeepL Translation ---")
     text = "Hello, I am testing the neural dubbing system."
+    translated = None
     try:
         translated = await service.translate_text(text, target_lang="ES")
         print(f"✅ Translated (ES): {translated}")
     except Exception as e:
         print(f"❌ Translation failed: {str(e)}")
+    if not has_deepl:
+        assert translated == "This is a translated test string.", f"unexpected translation: {translated!r}"
 
     # 2. Test Audio Generation
     print("\n--- Testing ElevenLabs Cloning ---")
+    local_path = None
     try:
         # Using a shortened version of the translated text
         audio_path = await service.generate_cloned_audio(translated, "test_user")
-        
-        if not has_eleven:
-            # Manually create a dummy file for the test to succeed if mocking
-            output_path = Path("./data/audio/dubbed_test_user.mp3")
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "wb") as f:
-                f.write(b"MOCK AUDIO DATA")
-            audio_path = str(output_path.absolute())
+        # The service returns the served URL path; the file lives under ./data
+        local_path = Path(".") / audio_path.lstrip("/")
 
         print(f"✅ Audio generated successfully at: {audio_path}")
-        if not os.path.exists(audio_path):
-            print(f"❌ ERROR: Audio file does not exist at {audio_path}")
+        if not local_path.exists():
+            print(f"❌ ERROR: Audio file does not exist at {local_path}")
     except Exception as e:
         print(f"❌ Audio generation failed: {str(e)}")
+    if not has_eleven:
+        assert local_path is not None and local_path.is_file(), f"no audio file written: {local_path}"
+        assert local_path.read_bytes() == b"MOCK AUDIO DATA"
+        local_path.unlink()
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Optional, test-only: faster event loop when installed
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(test_audio_service())
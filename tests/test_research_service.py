@@ -1,56 +1,136 @@
 import asyncio
+import functools
 import os
 import sys
 import json
+import re
 from pathlib import Path
-from unittest.mock import MagicMock, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock, patch
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from app.services.research_service import ResearchService
 
+# Sentence-level claim candidates, scanned over UTF-8 bytes in one C-level pass
+_CLAIM_RE = re.compile(rb'[^.!?]+[.!?]')
+
+def split_claim_candidates(transcript: str) -> list[str]:
+    return [m.group().decode().strip() for m in _CLAIM_RE.finditer(transcript.encode())]
+
+# Canned fact-check search responses, shared by every mock call (the service
+# only reads them)
+_RESP_87 = {"results": [{"content": "Studies show that only 20% of people prefer AI content."}]}
+_RESP_DEFAULT = {"results": [{"content": "Scientific evidence confirms the earth is a sphere and the moon is rock."}]}
+
+class BatchedTavily:
+    """Mock search adapter that coalesces concurrent queries into one pass."""
+
+    def __init__(self, search_fn, window: float = 0.005):
+        self.search_fn = search_fn
+        self.window = window
+        self.pending: list[tuple[str, dict, asyncio.Future]] = []
+        self.batches = 0
+        self._drainer = None
+
+    async def search(self, query, **kwargs):
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((query, kwargs, future))
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self):
+        # Let every claim search issued by the same gather enqueue first
+        await asyncio.sleep(self.window)
+        batch, self.pending = self.pending, []
+        self.batches += 1
+        for query, kwargs, future in batch:
+            if not future.done():
+                future.set_result(self.search_fn(query, **kwargs))
+
+_MOCK_TREND = "Autonomous agents now handle 40% of admin work, and GPT-5 was just announced."
+
+async def mock_completion(model, messages, **kwargs):
+    """Mock chat completion that answers each of the service's prompts by its system message."""
+    system, user = messages[0]["content"], messages[1]["content"]
+    if system.startswith("Extract"):
+        content = json.dumps({"claims": split_claim_candidates(user.removeprefix("TRANSCRIPT: "))})
+    elif system.startswith("Verify each claim"):
+        claims = json.loads(user)["claims"]
+        content = json.dumps({"results": [
+            {"verdict": "Incorrect", "explanation": f"Search context contradicts: {c['context']}"}
+            for c in claims
+        ]})
+    else:
+        content = _MOCK_TREND
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
 async def test_research_service():
     print("🚀 Starting ResearchService Test...")
     
     # Check if we have Tavily API key
     has_keys = bool(os.getenv("TAVILY_API_KEY"))
+    has_openai = bool(os.getenv("OPENAI_API_KEY"))
     
-    service = ResearchService()
+    if has_openai:
+        service = ResearchService()
+    else:
+        print("⚠️ OPENAI_API_KEY missing. Using MOCKS for GPT calls.")
+        # Patched only for construction, so no shared client (or env var) is left behind
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=mock_completion)
+        with patch("app.services.research_service.get_openai_client", return_value=mock_client):
+            service = ResearchService()
     
     if not has_keys:
         print("⚠️ TAVILY_API_KEY missing. Using MOCKS for testing.")
         # Mock Tavily client
-        service.tavily = MagicMock()
-        service.tavily.search.return_value = {
+        service.tavily_async = MagicMock()
+        service.tavily_async.search = AsyncMock(return_value={
             "results": [
                 {"title": "OpenAI announces GPT-5", "content": "OpenAI has officially announced their next generation model, GPT-5, promising revolutionary capabilities."},
                 {"title": "AI Agents taking over the workplace", "content": "A new report shows that 40% of administrative tasks are now being handled by autonomous agents."}
             ]
-        }
+        })
     
     # 1. Test Trend-Jacking
     print("\n--- Testing Trend-Jacking ---")
     topic = "Autonomous AI Agents"
+    trend = None
     try:
         trend = await service.get_trending_context(topic)
         print(f"✅ Trend Context: {trend}")
     except Exception as e:
         print(f"❌ Trend-jacking failed: {str(e)}")
+    if not has_keys and not has_openai:
+        assert trend == _MOCK_TREND, f"unexpected trend context: {trend!r}"
 
     # 2. Test Fact-Checking
     print("\n--- Testing Fact-Checking ---")
     transcript = "We found that 87% of people prefer AI-generated content over human content. Also, the world is flat and the moon is made of cheese."
+    candidates = split_claim_candidates(transcript)
+    print(f"   {len(candidates)} candidate sentences in transcript")
+    assert candidates == [
+        "We found that 87% of people prefer AI-generated content over human content.",
+        "Also, the world is flat and the moon is made of cheese.",
+    ], f"unexpected claim split: {candidates}"
     
     if not has_keys:
-        # Mock search results for specific claims
+        # Mock search results for specific claims, memoized per distinct query;
+        # the cache stores references to the preallocated responses
+        @functools.lru_cache(maxsize=1024)
+        def cached_search(query):
+            return _RESP_87 if "87%" in query else _RESP_DEFAULT
+        
         def mock_search(query, **kwargs):
-            if "87%" in query:
-                return {"results": [{"content": "Studies show that only 20% of people prefer AI content."}]}
-            return {"results": [{"content": "Scientific evidence confirms the earth is a sphere and the moon is rock."}]}
+            return cached_search(query)
             
-        service.tavily.search.side_effect = mock_search
+        batched_search = BatchedTavily(mock_search)
+        service.tavily_async.search = batched_search.search
 
+    verifications = None
     try:
         verifications = await service.fact_check_claims(transcript)
         print(f"✅ Fact-Checking Results:")
@@ -58,8 +138,21 @@ async def test_research_service():
             print(f"   - Claim: {v['claim']}")
             print(f"     Verdict: {v['verdict']}")
             print(f"     Explanation: {v['explanation']}")
+        if not has_keys:
+            print(f"   ({len(verifications)} claims searched in {batched_search.batches} batch(es))")
     except Exception as e:
         print(f"❌ Fact-checking failed: {str(e)}")
+    if not has_keys and not has_openai:
+        assert verifications is not None, "fact_check_claims raised"
+        assert [v["claim"] for v in verifications] == candidates, f"unexpected claims: {verifications}"
+        assert [v["verdict"] for v in verifications] == ["Incorrect", "Incorrect"], f"unexpected verdicts: {verifications}"
+        assert batched_search.batches == 1, f"claim searches split into {batched_search.batches} batches"
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Optional, test-only: faster event loop when installed
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(test_research_service())
@@ -1,37 +1,200 @@
 import asyncio
 import httpx
-import json
+import os
 import time
 import sys
-from datetime import datetime
+from collections import Counter
+
+try:
+    import orjson
+except ImportError:  # stdlib json has the same loads/JSONDecodeError surface
+    import json as orjson
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Parsed stream event: fixed fields, `data` left loosely typed
+if msgspec is not None:
+    class Event(msgspec.Struct, kw_only=True):
+        type: str | None = None
+        message: str | None = None
+        data: dict | list | str | None = None
+        error: str | None = None
+
+    decode_event = msgspec.json.Decoder(Event).decode
+    EventDecodeError = msgspec.DecodeError
+else:
+    class Event:
+        __slots__ = ("type", "message", "data", "error")
+
+        def __init__(self, type=None, message=None, data=None, error=None):
+            self.type = type
+            self.message = message
+            self.data = data
+            self.error = error
+
+    def decode_event(line):
+        raw = orjson.loads(line)
+        return Event(raw.get("type"), raw.get("message"), raw.get("data"), raw.get("error"))
+
+    EventDecodeError = orjson.JSONDecodeError
 
 # Configuration
-API_URL = "http://localhost:8000/process-video-stream"
+# Live test: under pytest it only runs when STREAM_API_URL names a running server
+API_URL = os.getenv("STREAM_API_URL", "http://localhost:8000/process-video-stream")
 TEST_VIDEO_URL = "https://www.youtube.com/watch?v=KcCFP6o56h0"
 CLIENT_ID = "test_user_rigorous"
 TONE_PROFILE = "controversial"
 
-async def run_test():
+# Tracked event types, in summary order
+EVENT_TYPES = (
+    "status", "transcript", "analysis", "linkedin", "twitter", "blog", "hooks",
+    "broll", "seo", "newsletter", "airtable", "complete", "error",
+)
+KNOWN = frozenset(EVENT_TYPES)
+
+READ_CHUNK_SIZE = 64 * 1024  # Fewer socket reads than httpx's small default
+
+# One keep-alive client per run, shared by every request the test makes
+_CLIENT: httpx.AsyncClient | None = None
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared test client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            timeout=300.0,
+            http2=False,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4)
+        )
+    return _CLIENT
+
+async def close_client():
+    """Close the shared client (on the loop that opened it)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+async def iter_stream_lines(response):
+    """Yield newline-delimited lines (bytes) from a response, read in 64 KiB chunks."""
+    buf = bytearray()
+    async for chunk in response.aiter_bytes(chunk_size=READ_CHUNK_SIZE):
+        buf += chunk
+        while (nl := buf.find(b"\n")) != -1:
+            line = bytes(buf[:nl])
+            del buf[:nl + 1]
+            yield line
+    if buf:
+        yield bytes(buf)
+
+# Event log lines, written to stdout in batches instead of one print each
+FLUSH_EVERY = 16
+FLUSH_INTERVAL = 0.5  # Seconds; keeps slow streams showing live progress
+_OUT: list[str] = []
+
+def emit(line):
+    _OUT.append(line + "\n")
+
+def flush_output():
+    if _OUT:
+        sys.stdout.write("".join(_OUT))
+        sys.stdout.flush()
+        _OUT.clear()
+
+# Formatted wall-clock second, reused by every event in the same second
+_last_ts = [0, ""]
+
+def ts():
+    s = int(time.time())
+    if s != _last_ts[0]:
+        _last_ts[0] = s
+        _last_ts[1] = time.strftime("%H:%M:%S", time.localtime(s))
+    return _last_ts[1]
+
+# Shared fallback for missing payloads (never mutated), so misses don't allocate
+_EMPTY: dict = {}
+
+# Per-event-type log handlers, each taking (Event, timestamp)
+def _h_status(event, timestamp):
+    emit(f"[{timestamp}] ℹ️  STATUS: {event.message}")
+
+def _h_transcript(event, timestamp):
+    data = event.data or _EMPTY
+    text_len = len(data.get("full_text", ""))
+    emit(f"[{timestamp}] 📝 TRANSCRIPT: {text_len} chars")
+    if text_len < 100:
+        emit("⚠️  WARNING: Transcript seems suspiciously short!")
+
+def _h_analysis(event, timestamp):
+    data = event.data or _EMPTY
+    emit(f"[{timestamp}] 🧠 ANALYSIS: Big Idea: '{data.get('big_idea')}'")
+
+def _h_linkedin(event, timestamp):
+    emit(f"[{timestamp}] 👔 LINKEDIN: Generated ({len(event.data or '')} chars)")
+
+def _h_twitter(event, timestamp):
+    tweets = event.data or ()
+    emit(f"[{timestamp}] 🐦 TWITTER: {len(tweets)} tweets generated")
+
+def _h_blog(event, timestamp):
+    emit(f"[{timestamp}] ✍️  BLOG: Generated ({len(event.data or '')} chars)")
+
+def _h_hooks(event, timestamp):
+    hooks = event.data or ()
+    emit(f"[{timestamp}] 🪝 HOOKS: {len(hooks)} variants generated")
+
+def _h_broll(event, timestamp):
+    images = event.data or ()
+    emit(f"[{timestamp}] 🖼️  B-ROLL: {len(images)} images found")
+
+def _h_seo(event, timestamp):
+    score = event.data or _EMPTY
+    emit(f"[{timestamp}] 🔍 SEO: Grade {score.get('grade')} ({score.get('score')}/{score.get('max_score')})")
+
+def _h_newsletter(event, timestamp):
+    emit(f"[{timestamp}] 📧 NEWSLETTER: HTML Generated")
+
+def _h_airtable(event, timestamp):
+    emit(f"[{timestamp}] 💾 AIRTABLE: Saved (Record ID: {(event.data or _EMPTY).get('id', 'N/A')})")
+
+def _h_complete(event, timestamp):
+    emit(f"[{timestamp}] ✅ COMPLETE: {event.message}")
+
+def _h_error(event, timestamp):
+    emit(f"[{timestamp}] ❌ ERROR: {event.error}")
+
+HANDLERS = {
+    "status": _h_status,
+    "transcript": _h_transcript,
+    "analysis": _h_analysis,
+    "linkedin": _h_linkedin,
+    "twitter": _h_twitter,
+    "blog": _h_blog,
+    "hooks": _h_hooks,
+    "broll": _h_broll,
+    "seo": _h_seo,
+    "newsletter": _h_newsletter,
+    "airtable": _h_airtable,
+    "complete": _h_complete,
+    "error": _h_error,
+}
+
+async def test_streaming_full():
+    try:
+        await _run_stream_test()
+    finally:
+        await close_client()
+
+async def _run_stream_test():
     print(f"🚀 Starting Rigorous Test for: {TEST_VIDEO_URL}")
     print(f"Target Endpoint: {API_URL}")
     print("-" * 60)
 
     start_time = time.time()
-    events_received = {
-        "status": 0,
-        "transcript": 0,
-        "analysis": 0,
-        "linkedin": 0,
-        "twitter": 0,
-        "blog": 0,
-        "hooks": 0,
-        "broll": 0,
-        "seo": 0,
-        "newsletter": 0,
-        "airtable": 0,
-        "complete": 0,
-        "error": 0
-    }
+    events_received = Counter()
     
     payload = {
         "video_url": TEST_VIDEO_URL,
@@ -40,91 +203,61 @@ async def run_test():
     }
 
     try:
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            async with client.stream("POST", API_URL, json=payload) as response:
-                if response.status_code != 200:
-                    print(f"❌ API Error: Status {response.status_code}")
-                    print(await response.aread())
-                    return
-
-                print("✅ Connection Established. Receiving Stream...")
-                
-                async for line in response.aiter_lines():
-                    if not line.strip():
+        client = get_client()
+        async with client.stream("POST", API_URL, json=payload) as response:
+            if response.status_code != 200:
+                body = await response.aread()
+                raise AssertionError(f"API Error: Status {response.status_code}: {body[:500]!r}")
+
+            print("✅ Connection Established. Receiving Stream...")
+            
+            events_since_flush = 0
+            last_flush = time.monotonic()
+            async for line in iter_stream_lines(response):
+                if not line.strip():
+                    continue
+                    
+                try:
+                    event = decode_event(line)
+                    event_type = event.type
+                    if event_type is None:
                         continue
+                    
+                    # Track event counts
+                    if event_type in KNOWN:
+                        events_received[event_type] += 1
+                    
+                    # Log specific details based on type
+                    handler = HANDLERS.get(event_type)
+                    if handler:
+                        handler(event, ts())
+                    
+                    events_since_flush += 1
+                    now = time.monotonic()
+                    if (events_since_flush >= FLUSH_EVERY or event_type == "complete"
+                            or now - last_flush >= FLUSH_INTERVAL):
+                        flush_output()
+                        events_since_flush = 0
+                        last_flush = now
                         
-                    try:
-                        event = json.loads(line)
-                        event_type = event.get("type", "unknown")
-                        
-                        # Track event counts
-                        if event_type in events_received:
-                            events_received[event_type] += 1
-                        
-                        # Log specific details based on type
-                        timestamp = datetime.now().strftime("%H:%M:%S")
-                        
-                        if event_type == "status":
-                            print(f"[{timestamp}] ℹ️  STATUS: {event.get('message')}")
-                            
-                        elif event_type == "transcript":
-                            data = event.get("data", {})
-                            text_len = len(data.get("full_text", ""))
-                            print(f"[{timestamp}] 📝 TRANSCRIPT: {text_len} chars")
-                            if text_len < 100:
-                                print("⚠️  WARNING: Transcript seems suspiciously short!")
-                                
-                        elif event_type == "analysis":
-                            data = event.get("data", {})
-                            print(f"[{timestamp}] 🧠 ANALYSIS: Big Idea: '{data.get('big_idea')}'")
-                            
-                        elif event_type == "linkedin":
-                            print(f"[{timestamp}] 👔 LINKEDIN: Generated ({len(event.get('data', ''))} chars)")
-                            
-                        elif event_type == "twitter":
-                            tweets = event.get("data", [])
-                            print(f"[{timestamp}] 🐦 TWITTER: {len(tweets)} tweets generated")
-                            
-                        elif event_type == "blog":
-                            print(f"[{timestamp}] ✍️  BLOG: Generated ({len(event.get('data', ''))} chars)")
-                            
-                        elif event_type == "hooks":
-                            hooks = event.get("data", [])
-                            print(f"[{timestamp}] 🪝 HOOKS: {len(hooks)} variants generated")
-                            
-                        elif event_type == "broll":
-                            images = event.get("data", [])
-                            print(f"[{timestamp}] 🖼️  B-ROLL: {len(images)} images found")
-                            
-                        elif event_type == "seo":
-                            score = event.get("data", {})
-                            print(f"[{timestamp}] 🔍 SEO: Grade {score.get('grade')} ({score.get('score')}/{score.get('max_score')})")
-                            
-                        elif event_type == "newsletter":
-                            print(f"[{timestamp}] 📧 NEWSLETTER: HTML Generated")
-                            
-                        elif event_type == "airtable":
-                            print(f"[{timestamp}] 💾 AIRTABLE: Saved (Record ID: {event.get('data', {}).get('id', 'N/A')})")
-                            
-                        elif event_type == "complete":
-                            print(f"[{timestamp}] ✅ COMPLETE: {event.get('message')}")
-                            
-                        elif event_type == "error":
-                            print(f"[{timestamp}] ❌ ERROR: {event.get('error')}")
-                            events_received["error"] += 1
-                            
-                    except json.JSONDecodeError:
-                        print(f"❌ Failed to decode JSON: {line}")
+                except EventDecodeError:
+                    emit(f"❌ Failed to decode JSON: {line.decode(errors='replace')}")
 
+    except AssertionError:
+        flush_output()
+        raise
     except Exception as e:
-        print(f"❌ Test Failed with Exception: {str(e)}")
-        return
+        flush_output()
+        raise AssertionError(f"Test Failed with Exception: {str(e)}") from e
+
+    flush_output()
 
     duration = time.time() - start_time
     print("-" * 60)
     print(f"🏁 Test Finished in {duration:.2f} seconds")
     print("📊 Event Summary:")
-    for evt, count in events_received.items():
+    for evt in EVENT_TYPES:
+        count = events_received[evt]
         mark = "✅" if count > 0 or (evt == "error" and count == 0) else "⚠️ "
         if evt == "error" and count > 0: mark = "❌"
         print(f"  {mark} {evt.ljust(12)}: {count}")
@@ -133,15 +266,22 @@ async def run_test():
     required_events = ["transcript", "analysis", "linkedin", "twitter", "blog", "airtable"]
     missing = [evt for evt in required_events if events_received[evt] == 0]
     
-    if missing:
-        print(f"\n❌ FAILED: Missing required events: {', '.join(missing)}")
-        sys.exit(1)
-    elif events_received["error"] > 0:
-        print("\n❌ FAILED: Errors occurred during processing")
+    assert not missing, f"Missing required events: {', '.join(missing)}"
+    assert events_received["error"] == 0, "Errors occurred during processing"
+    print("\n✅ PASSED: All systems operational")
+
+async def main():
+    try:
+        await test_streaming_full()
+    except AssertionError as e:
+        print(f"\n❌ FAILED: {e}")
         sys.exit(1)
-    else:
-        print("\n✅ PASSED: All systems operational")
-        sys.exit(0)
 
 if __name__ == "__main__":
-    asyncio.run(run_test())
+    try:
+        import uvloop  # Optional, test-only: faster event loop when installed
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    asyncio.run(main())
@@ -1,6 +1,7 @@
 import asyncio
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -8,49 +9,96 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from app.services.visual_service import VisualIntelligenceService
 
+def _to_local(p):
+    """Map a served /data/... path to the local ./data checkout."""
+    return "data" + p[5:] if p.startswith("/data") else p
+
+def find_missing(paths):
+    """
+    Return the paths that don't exist: one directory scan per parent dir that
+    holds several of them, and overlapped stat calls for scattered leftovers.
+    """
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+    
+    missing = []
+    scattered = []
+    for directory, dir_paths in by_dir.items():
+        if len(dir_paths) == 1:
+            scattered.extend(dir_paths)
+            continue
+        try:
+            with os.scandir(directory or ".") as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+        missing.extend(p for p in dir_paths if os.path.basename(p) not in present)
+    
+    if scattered:
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            results = list(ex.map(os.path.exists, scattered))
+        missing.extend(p for p, ok in zip(scattered, results) if not ok)
+    return missing
+
 async def test_visual_service():
     print("🚀 Starting VisualIntelligenceService Test...")
     service = VisualIntelligenceService()
     
-    # 1. Test LinkedIn Carousel
-    print("\n--- Testing LinkedIn Carousel ---")
     title = "The Future of AI Agents"
     slides = [
         "AI is no longer just a chatbot; it's an autonomous operator.",
         "The shift from 'Chat-with-PDF' to 'Build-the-App' is here.",
         "We are entering the era of Omni-Core agents that can see, hear, and do."
     ]
+    transcript = "How to build an AI content agency in 2025. We will look at automation, multi-modal models, and how to scale with autonomous agents."
+    
+    # The two generators share no state, so run them concurrently
+    carousel_task = asyncio.create_task(service.generate_linkedin_carousel("test_user", title, slides, style="cyberpunk"))
+    thumbs_task = asyncio.create_task(service.generate_thumbnail_variants(transcript))
+    carousel_data, thumbnails = await asyncio.gather(carousel_task, thumbs_task, return_exceptions=True)
+    failures = []
     
+    # 1. Test LinkedIn Carousel
+    print("\n--- Testing LinkedIn Carousel ---")
     try:
-        carousel_data = await service.generate_linkedin_carousel("test_user", title, slides, style="cyberpunk")
+        if isinstance(carousel_data, Exception):
+            raise carousel_data
         print(f"✅ Carousel generated successfully at: {carousel_data}")
         
         # Verify local existence (map /data to local ./data)
-        local_pdf_path = carousel_data["pdf"].replace("/data", "data")
-        if not os.path.exists(local_pdf_path):
-            print(f"❌ ERROR: PDF file does not exist at {local_pdf_path}")
-            
-        for img_path in carousel_data["images"]:
-            local_img_path = img_path.replace("/data", "data")
-            if not os.path.exists(local_img_path):
-                print(f"❌ ERROR: Slide image does not exist at {local_img_path}")
+        local_pdf_path = _to_local(carousel_data["pdf"])
+        local_img_paths = [_to_local(img_path) for img_path in carousel_data["images"]]
+        for local_path in find_missing([local_pdf_path, *local_img_paths]):
+            kind = "PDF file" if local_path == local_pdf_path else "Slide image"
+            print(f"❌ ERROR: {kind} does not exist at {local_path}")
+            failures.append(f"missing {local_path}")
     except Exception as e:
         print(f"❌ Carousel generation failed: {str(e)}")
+        failures.append(f"carousel: {e}")
 
     # 2. Test Thumbnail Variants
     print("\n--- Testing Thumbnail Variants ---")
-    transcript = "How to build an AI content agency in 2025. We will look at automation, multi-modal models, and how to scale with autonomous agents."
-    
     try:
-        thumbnails = await service.generate_thumbnail_variants(transcript)
+        if isinstance(thumbnails, Exception):
+            raise thumbnails
         print(f"✅ {len(thumbnails)} Thumbnails generated successfully:")
         for i, path in enumerate(thumbnails):
             print(f"   [{i}] {path}")
-            local_path = path.replace("/data", "data")
-            if not os.path.exists(local_path):
-                print(f"   ❌ ERROR: Thumbnail file does not exist at {local_path}")
+        for local_path in find_missing([_to_local(path) for path in thumbnails]):
+            print(f"   ❌ ERROR: Thumbnail file does not exist at {local_path}")
+            failures.append(f"missing {local_path}")
     except Exception as e:
         print(f"❌ Thumbnail generation failed: {str(e)}")
+        failures.append(f"thumbnails: {e}")
+
+    assert not failures, "; ".join(failures)
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Optional, test-only: faster event loop when installed
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(test_visual_service())
@@ -0,0 +1,130 @@
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.whisper_service import WhisperBatcher
+
+# Only bounds a hang on failure; the checks below never depend on timing
+TIMEOUT = 10
+
+class Tracker:
+    """Counts jobs in flight and remembers the peak."""
+
+    def __init__(self):
+        self.inflight = 0
+        self.peak = 0
+
+    async def run(self, wait_for: asyncio.Event, result):
+        self.inflight += 1
+        self.peak = max(self.peak, self.inflight)
+        try:
+            await wait_for.wait()
+            return result
+        finally:
+            self.inflight -= 1
+
+async def test_whisper_batcher():
+    print("🚀 Starting WhisperBatcher Test...")
+    batcher = WhisperBatcher()
+
+    # 1. A late small job must not wait behind an in-flight slow batch: the
+    #    slow job only finishes once the small one has
+    print("\n--- Testing Late Job Isolation ---")
+    small_done = asyncio.Event()
+    slow_started = asyncio.Event()
+
+    async def slow_job():
+        slow_started.set()
+        await small_done.wait()
+        return "slow"
+
+    async def small_job():
+        return "small"
+
+    slow = asyncio.create_task(batcher.submit(slow_job))
+    await asyncio.wait_for(slow_started.wait(), TIMEOUT)
+    result = await asyncio.wait_for(batcher.submit(small_job), TIMEOUT)
+    small_done.set()
+    print("✅ Small job finished while the slow batch was in flight")
+    assert result == "small"
+    assert await asyncio.wait_for(slow, TIMEOUT) == "slow"
+
+    # 2. More jobs than one batch holds still run concurrently: every job
+    #    waits until all of them are in flight at once
+    print("\n--- Testing Batch Overflow ---")
+    tracker = Tracker()
+    all_in = asyncio.Event()
+    n_jobs = batcher.batch_size + 4
+
+    async def overflow_job():
+        if tracker.inflight + 1 == n_jobs:
+            all_in.set()
+        return await tracker.run(all_in, "ok")
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*[batcher.submit(overflow_job) for _ in range(n_jobs)]), TIMEOUT
+    )
+    print(f"✅ {len(results)} jobs ran with {tracker.peak} in flight at once")
+    assert results == ["ok"] * n_jobs
+    assert tracker.peak == n_jobs
+
+    # 3. max_concurrency caps the requests in flight across batches
+    print("\n--- Testing Concurrency Limit ---")
+    limited = WhisperBatcher(batch_size=4, max_concurrency=3)
+    tracker = Tracker()
+    release = asyncio.Event()
+
+    async def limited_job():
+        return await tracker.run(release, "ok")
+
+    submitted = [asyncio.create_task(limited.submit(limited_job)) for _ in range(10)]
+    while tracker.inflight < 3:
+        await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.wait_for(asyncio.gather(*submitted), TIMEOUT)
+    print(f"✅ Peak in flight: {tracker.peak}")
+    assert results == ["ok"] * 10
+    assert tracker.peak == 3
+
+    # 4. Failures reach the caller that submitted them
+    print("\n--- Testing Error Propagation ---")
+    async def failing():
+        raise RuntimeError("boom")
+    try:
+        await asyncio.wait_for(batcher.submit(failing), TIMEOUT)
+    except RuntimeError as e:
+        print(f"✅ Error propagated: {e}")
+    else:
+        raise AssertionError("expected RuntimeError from failing job")
+
+    # 5. Closing a batcher (replaced on a new loop) cancels its in-flight and queued jobs
+    print("\n--- Testing Close ---")
+    blocker = asyncio.Event()
+    started = asyncio.Event()
+
+    async def blocked_job():
+        started.set()
+        await blocker.wait()
+
+    in_flight = asyncio.create_task(batcher.submit(blocked_job))
+    await asyncio.wait_for(started.wait(), TIMEOUT)
+    queued = [asyncio.create_task(batcher.submit(blocked_job)) for _ in range(3)]
+    await asyncio.sleep(0)
+    await batcher.close()
+    outcomes = await asyncio.wait_for(
+        asyncio.gather(in_flight, *queued, return_exceptions=True), TIMEOUT
+    )
+    assert all(isinstance(o, asyncio.CancelledError) for o in outcomes), outcomes
+    print("✅ Queued and in-flight jobs cancelled")
+
+if __name__ == "__main__":
+    try:
+        import uvloop  # Optional, test-only: faster event loop when installed
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(test_whisper_batcher())